@@ -1,16 +1,150 @@
 # codexify/cli.py
 import os
 import sys
-import argparse
-import fnmatch
-from typing import Dict, Any, Optional, List
-import yaml
+import functools
+import io
+import stat
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Callable, Tuple
 
 from .main import generate_compiled_output
 from .types import CompilationConfig
-from .core.common import CONFIG_FILE_PATTERN, DEFAULT_OUTPUT_BASENAME
+from .core.common import (
+    CONFIG_FILE_PATTERN,
+    CONFIG_FILE_REGEX,
+    CONFIG_FILE_EXAMPLE,
+    DEFAULT_OUTPUT_BASENAME_NO_EXT,
+    is_under,
+)
 from .core.file_system import get_parent_folder_name
 
+if TYPE_CHECKING:
+    # argparse is only needed once a parser is built; see `_build_parser`.
+    import argparse
+
+# Location of this module, resolved once; used to keep the CLI itself out of
+# compiled output when it lives inside the scanned project. `__file__` can be
+# missing in frozen builds, in which case `run_cli` falls back to sys.argv[0].
+_THIS_FILE: Optional[str] = (
+    os.path.abspath(__file__) if globals().get("__file__") else None
+)
+
+_PACKAGE_NAME = "codexify"
+# Resolved once at import for `--version`, rather than on every parser build.
+try:
+    from .version import __version__ as _VERSION
+except ImportError:
+    _VERSION = "unknown"
+
+# Config file names that may be loaded, and whether every name matching
+# CONFIG_FILE_PATTERN already has one of them (decided here, once).
+_CONFIG_FILE_SUFFIXES = (".yaml", ".yml")
+_CONFIG_PATTERN_HAS_SUFFIX = CONFIG_FILE_PATTERN.lower().endswith(_CONFIG_FILE_SUFFIXES)
+
+# The same handful of paths (config, project, gitignore, script) are resolved
+# repeatedly during a single CLI run; memoize them, along with the working
+# directory itself so relative paths don't each cost a getcwd() syscall.
+# Caches are cleared at the start and end of `run_cli` so a changed working
+# directory is never served stale results.
+_cwd = functools.lru_cache(maxsize=1)(os.getcwd)
+_normpath = functools.lru_cache(maxsize=256)(os.path.normpath)
+# Stats its argument; called for the same --path by both run_cli and --save.
+_parent_folder_name = functools.lru_cache(maxsize=32)(get_parent_folder_name)
+
+
+@functools.lru_cache(maxsize=256)
+def _abspath(path: str) -> str:
+    """`os.path.abspath` against the working directory cached by `_cwd`."""
+    if not os.path.isabs(path):
+        path = os.path.join(_cwd(), path)
+    return os.path.normpath(path)
+
+
+def _classify_output(output_arg: str) -> Tuple[str, Optional[str]]:
+    """
+    Splits an `--output` argument into an output directory and base name.
+
+    The argument is split once and probed with a single `os.stat`: an existing
+    directory is used as-is, anything else is taken as a file name whose
+    `.txt` suffix (if any) is stripped.
+
+    Args:
+        output_arg: The `--output` value, preferably already made absolute.
+
+    Returns:
+        A tuple (output_dir, base_no_ext). `base_no_ext` is None when
+        `output_arg` is an existing directory, leaving the caller to pick
+        a default base name.
+    """
+    try:
+        if stat.S_ISDIR(os.stat(output_arg).st_mode):
+            return output_arg, None
+    except OSError:
+        pass
+    head, tail = os.path.split(output_arg)
+    if not tail:
+        # Trailing separator: a directory that does not exist yet.
+        return head, None
+    tail_root, tail_ext = os.path.splitext(tail)
+    if tail_ext.lower() == ".txt":
+        tail = tail_root
+    return head, tail
+
+
+def _rel_or_abs(target: str, start: str) -> str:
+    """
+    Returns `target` relative to `start`, or `target` itself across drives.
+
+    The drive check replaces a `try: os.path.relpath(...) except ValueError`
+    dance; on POSIX `splitdrive` always yields an empty drive, so this is
+    simply `relpath`.
+
+    Args:
+        target: The absolute path to express.
+        start: The absolute directory to make `target` relative to.
+
+    Returns:
+        The relative path, or `target` unchanged when the two paths are on
+        different drives (e.g. "C:" and "D:" on Windows).
+    """
+    target_drive = os.path.splitdrive(target)[0]
+    start_drive = os.path.splitdrive(start)[0]
+    if os.path.normcase(target_drive) != os.path.normcase(start_drive):
+        return target
+    return os.path.relpath(target, start)
+
+
+def _no_log(*_args: Any, **_kwargs: Any) -> None:
+    """Stand-in for `print` when progress output is suppressed."""
+
+
+def _clear_path_caches() -> None:
+    """Drops the memoized working directory and path resolutions."""
+    _cwd.cache_clear()
+    _abspath.cache_clear()
+    _normpath.cache_clear()
+    _parent_folder_name.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _yaml_safe_classes(yaml_module: Any) -> Tuple[Any, Any]:
+    """
+    Picks the safe YAML loader and dumper classes once per PyYAML module.
+
+    The libyaml-backed `CSafeLoader`/`CSafeDumper` are preferred when PyYAML
+    was built with them; they produce the same results as the pure-Python
+    `SafeLoader`/`SafeDumper`.
+
+    Args:
+        yaml_module: The imported 'yaml' module (PyYAML).
+
+    Returns:
+        A tuple (loader_class, dumper_class).
+    """
+    return (
+        getattr(yaml_module, "CSafeLoader", yaml_module.SafeLoader),
+        getattr(yaml_module, "CSafeDumper", yaml_module.SafeDumper),
+    )
+
 
 def _load_config_from_yaml_for_cli(
     config_file_path: str, yaml_module: Any
@@ -43,22 +177,32 @@ def _load_config_from_yaml_for_cli(
         SystemExit: If the config file is not found, invalid, or essential fields are missing.
     """
     try:
-        abs_config_path = os.path.abspath(config_file_path)
+        abs_config_path = _abspath(config_file_path)
         config_basename = os.path.basename(config_file_path)
-        if not (
-            config_basename.lower().endswith(".yaml")
-            or config_basename.lower().endswith(".yml")
-        ):
+        # A name matching the pattern needs no separate suffix check, so the
+        # usual config file costs a single regex match.
+        matches_pattern = CONFIG_FILE_REGEX.match(config_basename) is not None
+        if not (matches_pattern and _CONFIG_PATTERN_HAS_SUFFIX) and os.path.splitext(
+            config_basename
+        )[1].lower() not in _CONFIG_FILE_SUFFIXES:
             print(
                 f"Warning: Config file '{config_file_path}' does not end with .yaml or .yml."
             )
-        if not fnmatch.fnmatch(config_basename, CONFIG_FILE_PATTERN):
+        if not matches_pattern:
             print(
                 f"Warning: Config file name '{config_basename}' doesn't match expected pattern '{CONFIG_FILE_PATTERN}'."
             )
 
-        with open(abs_config_path, "r", encoding="utf-8") as f:
-            loaded_config_any = yaml_module.safe_load(f)
+        # The file is read as bytes in one go and handed to the loader as-is,
+        # letting it detect the encoding (UTF-8 unless a BOM says otherwise).
+        yaml_loader = _yaml_safe_classes(yaml_module)[0]
+        with open(abs_config_path, "rb") as f:
+            config_data = f.read()
+        # Parse the bytes already in memory; the buffer carries the file's
+        # name so YAML errors still point at the config file.
+        config_stream = io.BytesIO(config_data)
+        config_stream.name = abs_config_path
+        loaded_config_any: Any = yaml_module.load(config_stream, Loader=yaml_loader)
         if not isinstance(loaded_config_any, dict):
             print(
                 f"Error: Config file '{config_file_path}' is empty or invalid YAML (not a dictionary)."
@@ -68,62 +212,65 @@ def _load_config_from_yaml_for_cli(
 
         config_dir = os.path.dirname(abs_config_path)
 
-        project_path_from_yaml_value = loaded_config.get("path")
-        abs_project_path_from_yaml: Optional[str] = None
-        if project_path_from_yaml_value is not None:
-            abs_project_path_from_yaml = os.path.normpath(
-                os.path.join(config_dir, str(project_path_from_yaml_value))
-            )
-
-        gitignore_in_yaml_value = loaded_config.get("gitignore")
-        resolved_gitignore_path: Optional[str] = None
-        if gitignore_in_yaml_value is not None:
-            str_gitignore_value = str(gitignore_in_yaml_value)
-            if os.path.isabs(str_gitignore_value):
-                resolved_gitignore_path = str_gitignore_value
-            else:
-                # MODIFICATION: Always resolve relative gitignore path from YAML
-                # relative to the config file's directory.
-                resolved_gitignore_path = os.path.normpath(
-                    os.path.join(config_dir, str_gitignore_value)
-                )
+        # Fetch every recognised key once; the rest of the function only
+        # works with these locals.
+        _get = loaded_config.get
+        project_path_from_yaml_value = _get("path")
+        gitignore_in_yaml_value = _get("gitignore")
+        extensions_value = _get("extensions")
+        packages_value = _get("packages", [])
+        output_value = _get("output", DEFAULT_OUTPUT_BASENAME_NO_EXT)
+        exclude_dirs_value = _get("exclude", [])
+        exclude_files_value = _get("exclude_files", [])
+
+        # MODIFICATION: Always resolve relative gitignore path from YAML
+        # relative to the config file's directory.
+        abs_project_path_from_yaml, resolved_gitignore_path, _ = _resolve_paths(
+            project_path=(
+                str(project_path_from_yaml_value)
+                if project_path_from_yaml_value is not None
+                else None
+            ),
+            gitignore=(
+                str(gitignore_in_yaml_value)
+                if gitignore_in_yaml_value is not None
+                else None
+            ),
+            base_dir=config_dir,
+            gitignore_relative_to_project=False,
+        )
 
-        if abs_project_path_from_yaml and "extensions" not in loaded_config:
+        if abs_project_path_from_yaml and extensions_value is None:
             print(
                 "Config Error: 'extensions' field is required when 'path' is specified."
             )
             sys.exit(1)
-        if not abs_project_path_from_yaml and not loaded_config.get("packages"):
+        if not abs_project_path_from_yaml and not packages_value:
             print(
                 "Config Error: Config must contain at least one of 'path' or 'packages'."
             )
             sys.exit(1)
 
-        default_output_base_no_ext = DEFAULT_OUTPUT_BASENAME
-        if default_output_base_no_ext.endswith(".txt"):
-            default_output_base_no_ext = default_output_base_no_ext[:-4]
-
-        output_base_no_ext_any = loaded_config.get("output", default_output_base_no_ext)
         output_base_no_ext: str
-        if isinstance(output_base_no_ext_any, str):
-            output_base_no_ext = output_base_no_ext_any
+        if isinstance(output_value, str):
+            output_base_no_ext = output_value
         else:
-            output_base_no_ext = default_output_base_no_ext
+            output_base_no_ext = DEFAULT_OUTPUT_BASENAME_NO_EXT
 
         return {
             "project_path": abs_project_path_from_yaml,
-            "extensions": loaded_config.get("extensions", []),
-            "go_packages": loaded_config.get("packages", []),
+            "extensions": extensions_value if extensions_value is not None else [],
+            "go_packages": packages_value,
             "output_base_name_no_ext": output_base_no_ext,
-            "exclude_dirs": loaded_config.get("exclude", []),
-            "exclude_files": loaded_config.get("exclude_files", []),
+            "exclude_dirs": exclude_dirs_value,
+            "exclude_files": exclude_files_value,
             "gitignore_file_path": resolved_gitignore_path,
             "config_source_dir": config_dir,  # This is key for output dir
         }
     except FileNotFoundError:
         print(f"Error: Config file not found: '{config_file_path}'")
         sys.exit(1)
-    except yaml.YAMLError as e:
+    except yaml_module.YAMLError as e:
         print(f"Error parsing YAML in config file '{config_file_path}': {e}")
         sys.exit(1)
     except Exception as e:
@@ -131,8 +278,59 @@ def _load_config_from_yaml_for_cli(
         sys.exit(1)
 
 
+def _resolve_paths(
+    *,
+    project_path: Optional[str],
+    gitignore: Optional[str],
+    base_dir: str,
+    gitignore_relative_to_project: bool,
+) -> Tuple[Optional[str], Optional[str], str]:
+    """
+    Resolves the project path, gitignore path and default output directory.
+
+    Shared by the YAML loader, `--save` and the plain CLI path so all three
+    apply the same rules with a single pass over the (cached) path helpers.
+
+    Args:
+        project_path: The project path as given, or None.
+        gitignore: The gitignore path as given, or None.
+        base_dir: The absolute directory relative paths are resolved against:
+                  the config file's directory for YAML, the CWD for the CLI.
+        gitignore_relative_to_project: If True, a relative gitignore path is
+                  resolved against the project path when there is one (CLI
+                  rule); otherwise always against `base_dir` (YAML rule).
+
+    Returns:
+        A tuple (abs_project_path, abs_gitignore_path, default_output_dir).
+        The paths are None when not given; an absolute gitignore path is
+        returned as-is. The default output directory is the directory a
+        relative gitignore path is anchored to.
+    """
+    abs_project_path: Optional[str] = None
+    if project_path is not None:
+        # Absolute paths (common in hand-written configs) need no join.
+        abs_project_path = _normpath(
+            project_path
+            if os.path.isabs(project_path)
+            else os.path.join(base_dir, project_path)
+        )
+
+    anchor_dir = base_dir
+    if gitignore_relative_to_project and abs_project_path:
+        anchor_dir = abs_project_path
+
+    abs_gitignore_path: Optional[str] = None
+    if gitignore is not None:
+        if os.path.isabs(gitignore):
+            abs_gitignore_path = gitignore
+        else:
+            abs_gitignore_path = _normpath(os.path.join(anchor_dir, gitignore))
+
+    return abs_project_path, abs_gitignore_path, anchor_dir
+
+
 def _save_config_for_cli(
-    args: argparse.Namespace,
+    args: "argparse.Namespace",
     yaml_module: Any,
     determined_output_dir: str,  # This is where config is saved
     output_base_name_no_ext_for_yaml: str,
@@ -168,14 +366,14 @@ def _save_config_for_cli(
     if args.config_name and isinstance(args.config_name, str):
         _name_candidate = args.config_name
     elif args.path and isinstance(args.path, str):
-        _name_candidate = get_parent_folder_name(args.path)
+        _name_candidate = _parent_folder_name(_abspath(args.path))
 
     config_name_base: str = (
         _name_candidate if _name_candidate and _name_candidate.strip() else "output"
     )
 
     config_basename_final = f"config.compiled.{config_name_base}.yaml"
-    config_filename = os.path.abspath(
+    config_filename = _abspath(
         os.path.join(determined_output_dir, config_basename_final)
     )
     config_file_actual_dir = os.path.dirname(
@@ -187,41 +385,31 @@ def _save_config_for_cli(
     else:
         print(f"Config file for saving: {config_filename}")
 
-    abs_cli_project_path: Optional[str] = None
-    if args.path and isinstance(args.path, str):
-        abs_cli_project_path = os.path.abspath(args.path)
+    # MODIFICATION: If CLI gitignore is relative, it's relative to CWD or --path,
+    # then made absolute. For saving, we make it relative to config dir.
+    abs_cli_project_path, abs_intended_cli_gitignore_path, _ = _resolve_paths(
+        project_path=(
+            args.path if args.path and isinstance(args.path, str) else None
+        ),
+        gitignore=(
+            args.gitignore
+            if args.gitignore and isinstance(args.gitignore, str)
+            else None
+        ),
+        base_dir=_cwd(),
+        gitignore_relative_to_project=True,
+    )
 
     path_in_yaml: Optional[str] = None
     if abs_cli_project_path:
-        try:
-            path_in_yaml = os.path.relpath(abs_cli_project_path, config_file_actual_dir)
-        except ValueError:
-            path_in_yaml = abs_cli_project_path
-
-    abs_intended_cli_gitignore_path: Optional[str] = None
-    if args.gitignore and isinstance(args.gitignore, str):
-        if os.path.isabs(args.gitignore):
-            abs_intended_cli_gitignore_path = args.gitignore
-        # MODIFICATION: If CLI gitignore is relative, it's relative to CWD or --path,
-        # then made absolute. For saving, we make it relative to config dir.
-        elif (
-            abs_cli_project_path
-        ):  # If --path is given, CLI gitignore is relative to it
-            abs_intended_cli_gitignore_path = os.path.normpath(
-                os.path.join(abs_cli_project_path, args.gitignore)
-            )
-        else:  # No --path, CLI gitignore is relative to CWD
-            abs_intended_cli_gitignore_path = os.path.abspath(args.gitignore)
+        path_in_yaml = _rel_or_abs(abs_cli_project_path, config_file_actual_dir)
 
     gitignore_in_yaml: Optional[str] = None
     if abs_intended_cli_gitignore_path:
-        try:
-            # MODIFICATION: Always make gitignore path in YAML relative to the config file's directory
-            gitignore_in_yaml = os.path.relpath(
-                abs_intended_cli_gitignore_path, config_file_actual_dir
-            )
-        except ValueError:  # Different drive on Windows, etc.
-            gitignore_in_yaml = abs_intended_cli_gitignore_path
+        # MODIFICATION: Always make gitignore path in YAML relative to the config file's directory
+        gitignore_in_yaml = _rel_or_abs(
+            abs_intended_cli_gitignore_path, config_file_actual_dir
+        )
 
     config_data["path"] = path_in_yaml
     config_data["extensions"] = args.extensions if args.extensions else []
@@ -231,16 +419,21 @@ def _save_config_for_cli(
     config_data["exclude_files"] = args.exclude_files if args.exclude_files else []
     config_data["gitignore"] = gitignore_in_yaml
 
+    yaml_dumper = _yaml_safe_classes(yaml_module)[1]
     print(f"Attempting to save configuration to: {config_filename}")
     try:
         os.makedirs(config_file_actual_dir, exist_ok=True)
-        with open(config_filename, "w", encoding="utf-8") as f:
-            yaml_module.safe_dump(
+        # With an explicit encoding the dumper emits UTF-8 bytes itself,
+        # skipping the text-mode file layer.
+        with open(config_filename, "wb") as f:
+            yaml_module.dump(
                 config_data,
                 f,
+                Dumper=yaml_dumper,
                 default_flow_style=None,
                 sort_keys=False,
                 allow_unicode=True,
+                encoding="utf-8",
             )
         print(f"Configuration successfully saved to '{config_filename}'.")
     except Exception as e:
@@ -249,15 +442,18 @@ def _save_config_for_cli(
     return config_filename
 
 
-def run_cli():
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> "argparse.ArgumentParser":
     """
-    Handles CLI argument parsing and orchestrates the compilation.
-    # ... (rest of docstring) ...
+    Builds the CLI argument parser once and reuses it for later `run_cli` calls.
+
+    Returns:
+        The configured `argparse.ArgumentParser`.
     """
-    package_name_str = "codexify"
+    import argparse
 
+    package_name_str = _PACKAGE_NAME
     parser = argparse.ArgumentParser(
-        # ... (parser setup remains the same) ...
         description="Codexify: Compiles project files into structured text for LLM context.",
         formatter_class=argparse.RawTextHelpFormatter,
         epilog=f"Example:\n  python3 -m {package_name_str}.cli --path ../p --ext .py --save\n  {package_name_str} --path ../p --ext .py --gitignore .gitignore",
@@ -282,7 +478,7 @@ def run_cli():
 
     parser.add_argument(
         "--config",
-        help=f"Path to YAML config file (e.g., {CONFIG_FILE_PATTERN.replace('*', 'myproject')}). Overrides most other CLI args.",
+        help=f"Path to YAML config file (e.g., {CONFIG_FILE_EXAMPLE}). Overrides most other CLI args.",
     )
     parser.add_argument(
         "--save",
@@ -330,17 +526,29 @@ def run_cli():
         help="Show this help message and exit.",
     )
 
-    try:
-        from .version import __version__ as version_str
-    except ImportError:
-        version_str = "unknown"
-    parser.add_argument(
-        "--version", action="version", version=f"%(prog)s {version_str}"
-    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {_VERSION}")
+    return parser
+
 
+def run_cli():
+    """
+    Handles CLI argument parsing and orchestrates the compilation.
+    # ... (rest of docstring) ...
+    """
+    package_name_str = _PACKAGE_NAME
+    if sys.argv[1:] == ["--version"]:
+        # Same output as argparse's version action, without building a parser.
+        print(f"{os.path.basename(sys.argv[0])} {_VERSION}")
+        sys.exit(0)
+    _clear_path_caches()
+
+    parser = _build_parser()
     args = parser.parse_args()
 
-    comp_config = CompilationConfig(verbose=not args.quiet)
+    # The CLI only reports on the written file, so let the output stream to disk.
+    comp_config = CompilationConfig(verbose=not args.quiet, keep_compiled_text=False)
+    # Progress messages go through `log`, which is a no-op under --quiet.
+    log: Callable[..., None] = print if comp_config.verbose else _no_log
     output_base_name_no_ext: str
     output_dir_cli: str  # This will be the final output directory
 
@@ -348,13 +556,16 @@ def run_cli():
     cli_path_arg: Optional[str] = args.path
     cli_extensions_arg: Optional[List[str]] = args.extensions
     cli_packages_arg: Optional[List[str]] = args.packages
-    cli_exclude_arg: List[str] = args.exclude
-    cli_exclude_files_arg: List[str] = args.exclude_files
+    # Copies, so the cached parser's shared defaults are never handed out.
+    cli_exclude_arg: List[str] = list(args.exclude)
+    cli_exclude_files_arg: List[str] = list(args.exclude_files)
     # `cli_gitignore_arg` from `args.gitignore` will be processed based on context (config or not)
     cli_output_arg: Optional[str] = args.output  # From --output
 
     if args.config and isinstance(args.config, str):
         try:
+            import yaml
+
             cli_loaded_yaml_config = _load_config_from_yaml_for_cli(args.config, yaml)
         except ImportError:
             print(
@@ -380,14 +591,15 @@ def run_cli():
         # MODIFICATION: When --config is used, output_dir_cli is ALWAYS the config file's directory.
         output_dir_cli = cli_loaded_yaml_config["config_source_dir"]
 
-        if comp_config.verbose:
-            print(f"Loaded configuration from: {args.config}")
-        if comp_config.verbose:
-            print(f"Output directory (from config): {output_dir_cli}")
-        if comp_config.gitignore_file_path and comp_config.verbose:
-            print(
+        config_messages = [
+            f"Loaded configuration from: {args.config}",
+            f"Output directory (from config): {output_dir_cli}",
+        ]
+        if comp_config.gitignore_file_path:
+            config_messages.append(
                 f"Gitignore path (from config, resolved): {comp_config.gitignore_file_path}"
             )
+        log("\n".join(config_messages))
 
     else:  # No --config, using direct CLI args
         if not cli_path_arg and not cli_packages_arg:
@@ -399,162 +611,102 @@ def run_cli():
                 "--extensions (--ext) are required when --path is specified without --config."
             )
 
-        if cli_path_arg:
-            comp_config.project_path = os.path.abspath(cli_path_arg)
-        else:
-            comp_config.project_path = (
-                None  # Should not happen due to check above if no packages
-            )
+        # A relative --gitignore is relative to --path if given, else to CWD;
+        # the default output directory follows the same rule.
+        (
+            comp_config.project_path,
+            comp_config.gitignore_file_path,
+            default_output_dir,
+        ) = _resolve_paths(
+            project_path=cli_path_arg if cli_path_arg else None,
+            gitignore=args.gitignore if args.gitignore else None,
+            base_dir=_cwd(),
+            gitignore_relative_to_project=True,
+        )
 
         comp_config.extensions = cli_extensions_arg if cli_extensions_arg else []
         comp_config.go_packages = cli_packages_arg if cli_packages_arg else []
         comp_config.exclude_dirs = cli_exclude_arg
         comp_config.exclude_files = cli_exclude_files_arg
 
-        # Handle gitignore path for CLI mode
-        if args.gitignore:  # User provided --gitignore
-            if os.path.isabs(args.gitignore):
-                comp_config.gitignore_file_path = args.gitignore
-            elif (
-                comp_config.project_path
-            ):  # If --path is given, gitignore is relative to it
-                comp_config.gitignore_file_path = os.path.normpath(
-                    os.path.join(comp_config.project_path, args.gitignore)
-                )
-            else:  # No --path, gitignore is relative to CWD
-                comp_config.gitignore_file_path = os.path.abspath(args.gitignore)
-        else:  # No --gitignore provided
-            comp_config.gitignore_file_path = None
-
-        if comp_config.gitignore_file_path and comp_config.verbose:
-            print(
-                f"Gitignore path (from CLI, resolved): {comp_config.gitignore_file_path}"
-            )
+        if comp_config.gitignore_file_path:
+            log(f"Gitignore path (from CLI, resolved): {comp_config.gitignore_file_path}")
 
         # Determine output_dir_cli and output_base_name_no_ext for CLI mode
         if cli_output_arg:  # --output was given
-            abs_cli_output_arg = os.path.abspath(cli_output_arg)
-            output_base_name_from_arg = os.path.basename(abs_cli_output_arg)
-
-            # If --output looks like a file name (e.g. "report" or "report.txt")
-            if output_base_name_from_arg and (
-                "." in output_base_name_from_arg
-                or not os.path.isdir(abs_cli_output_arg)
-            ):
-                output_base_name_no_ext = (
-                    output_base_name_from_arg[:-4]
-                    if output_base_name_from_arg.lower().endswith(".txt")
-                    else output_base_name_from_arg
-                )
-                output_dir_cli = os.path.dirname(abs_cli_output_arg)
-                if not output_dir_cli:  # e.g. --output myreport (no path part)
-                    output_dir_cli = (
-                        comp_config.project_path
-                        if comp_config.project_path
-                        else os.getcwd()
-                    )
-            else:  # --output looks like a directory path (e.g. "./out_dir" or "/abs/out_dir")
-                output_dir_cli = abs_cli_output_arg
+            output_dir_cli, output_base_name_no_ext = _classify_output(
+                _abspath(cli_output_arg)
+            )
+            if output_base_name_no_ext is None:
+                # --output names an existing directory (e.g. "./out_dir")
                 parent_name = (
-                    get_parent_folder_name(comp_config.project_path)
+                    _parent_folder_name(comp_config.project_path)
                     if comp_config.project_path
                     else None
                 )
-                default_base = (
-                    DEFAULT_OUTPUT_BASENAME[:-4]
-                    if DEFAULT_OUTPUT_BASENAME.lower().endswith(".txt")
-                    else DEFAULT_OUTPUT_BASENAME
+                output_base_name_no_ext = (
+                    parent_name if parent_name else DEFAULT_OUTPUT_BASENAME_NO_EXT
                 )
-                output_base_name_no_ext = parent_name if parent_name else default_base
+            elif not output_dir_cli:  # e.g. --output myreport (no path part)
+                output_dir_cli = default_output_dir
         else:  # --output was NOT given, derive from --path or use default
             parent_name = (
-                get_parent_folder_name(comp_config.project_path)
+                _parent_folder_name(comp_config.project_path)
                 if comp_config.project_path
                 else None
             )
-            default_base = (
-                DEFAULT_OUTPUT_BASENAME[:-4]
-                if DEFAULT_OUTPUT_BASENAME.lower().endswith(".txt")
-                else DEFAULT_OUTPUT_BASENAME
+            output_base_name_no_ext = (
+                parent_name if parent_name else DEFAULT_OUTPUT_BASENAME_NO_EXT
             )
-            output_base_name_no_ext = parent_name if parent_name else default_base
 
-            if comp_config.project_path:
-                output_dir_cli = comp_config.project_path  # Output to project_path dir
-            else:
-                output_dir_cli = os.getcwd()  # Output to CWD
+            output_dir_cli = default_output_dir  # project_path dir, else CWD
 
-        if comp_config.verbose:
-            print("Using command-line arguments for configuration.")
-        if comp_config.verbose:
-            print(f"Output directory (from CLI args): {output_dir_cli}")
+        log(
+            "Using command-line arguments for configuration.\n"
+            f"Output directory (from CLI args): {output_dir_cli}"
+        )
 
-    # Ensure output_dir_cli is a directory and exists
-    if os.path.isfile(output_dir_cli):  # If it accidentally resolved to a file
+    # Ensure output_dir_cli is a directory and exists. makedirs already handles
+    # the "exists" case; it only raises FileExistsError if the path is a file.
+    try:
+        os.makedirs(output_dir_cli, exist_ok=True)  # Create if not exists
+    except FileExistsError:  # If it accidentally resolved to a file
         output_dir_cli = os.path.dirname(output_dir_cli)
-    os.makedirs(output_dir_cli, exist_ok=True)  # Create if not exists
+        os.makedirs(output_dir_cli, exist_ok=True)
 
     final_output_filename = f"compiled.{output_base_name_no_ext}.txt"
     comp_config.output_file_path = os.path.join(output_dir_cli, final_output_filename)
-    if comp_config.verbose:
-        print(f"Output file will be: {comp_config.output_file_path}")
+    log(f"Output file will be: {comp_config.output_file_path}")
 
-    # Add self to permanent exclusions (remains the same)
+    # Add self to permanent exclusions
     if comp_config.project_path:
-        try:
-            cli_module_file_path = __import__(
-                f"{package_name_str}.cli", fromlist=["__file__"]
-            ).__file__
-            if cli_module_file_path:
-                abs_script_path = os.path.abspath(cli_module_file_path)
-                # Ensure project_path is absolute for comparison
-                abs_project_path_for_compare = os.path.abspath(comp_config.project_path)
-                if (
-                    os.path.commonpath([abs_script_path, abs_project_path_for_compare])
-                    == abs_project_path_for_compare
-                ):
-                    script_rel_path = os.path.relpath(
-                        abs_script_path, abs_project_path_for_compare
-                    )
-                    comp_config.additional_path_permanent_exclusions.add(
-                        script_rel_path.replace(os.sep, "/")
-                    )
-                    if comp_config.verbose:
-                        print(f"Excluding self (module): {script_rel_path}")
-        except (ImportError, AttributeError, TypeError, ValueError):
-            if sys.argv and sys.argv[0] and sys.argv[0].endswith(".py"):
-                try:
-                    potential_script_path = os.path.abspath(sys.argv[0])
-                    abs_project_path_for_compare = os.path.abspath(
-                        comp_config.project_path
-                    )
-                    if (
-                        os.path.commonpath(
-                            [potential_script_path, abs_project_path_for_compare]
-                        )
-                        == abs_project_path_for_compare
-                    ):
-                        script_rel_path = os.path.relpath(
-                            potential_script_path, abs_project_path_for_compare
-                        )
-                        comp_config.additional_path_permanent_exclusions.add(
-                            script_rel_path.replace(os.sep, "/")
-                        )
-                        if comp_config.verbose:
-                            print(f"Excluding self (script): {script_rel_path}")
-                except ValueError:
-                    pass  # commonpath issues if on different drives
-                except Exception:
-                    pass  # Catch all for safety
+        # project_path is already absolute and normalized by _resolve_paths,
+        # in both the --config and the plain CLI case.
+        abs_project_path_for_compare = comp_config.project_path
+        abs_script_path: Optional[str] = _THIS_FILE
+        self_kind = "module"
+        if not abs_script_path and sys.argv and sys.argv[0].endswith(".py"):
+            abs_script_path = _abspath(sys.argv[0])
+            self_kind = "script"
+        if abs_script_path and is_under(abs_script_path, abs_project_path_for_compare):
+            # Both paths are normalized, so the relative part is a slice.
+            script_rel_path = abs_script_path[
+                len(abs_project_path_for_compare) :
+            ].lstrip(os.sep)
+            if script_rel_path:
+                comp_config.additional_path_permanent_exclusions.add(
+                    script_rel_path.replace(os.sep, "/")
+                )
+                log(f"Excluding self ({self_kind}): {script_rel_path}")
 
     if args.save:
         if args.config:
-            if comp_config.verbose:
-                print("Warning: --save option is ignored when --config is used.")
+            log("Warning: --save option is ignored when --config is used.")
         else:
-            if comp_config.verbose:
-                print("Processing --save flag...")
+            log("Processing --save flag...")
             try:
+                import yaml
+
                 # For --save, the config file is saved in output_dir_cli
                 # output_base_name_no_ext is used for the 'output' field in YAML
                 _save_config_for_cli(
@@ -571,29 +723,35 @@ def run_cli():
                     f"An unexpected error occurred while trying to save YAML config: {e}"
                 )
                 sys.exit(1)
-            if comp_config.verbose:
-                print("Proceeding with compilation using the current arguments...")
+            log("Proceeding with compilation using the current arguments...")
 
     result = generate_compiled_output(comp_config)
+    _clear_path_caches()
 
     if result.success:
-        print("\n" + "-" * 40)
+        # The summary is written in one go rather than line by line.
+        summary_lines = ["\n" + "-" * 40]
         # No specific message for --save here anymore, it's part of the flow
-        print("Compilation completed successfully.")
+        summary_lines.append("Compilation completed successfully.")
         if result.output_file_path:
-            print(f"Output file: {result.output_file_path}")
-        print(f"Included content from {result.files_compiled_count} file(s).")
+            summary_lines.append(f"Output file: {result.output_file_path}")
+        summary_lines.append(
+            f"Included content from {result.files_compiled_count} file(s)."
+        )
         if result.files_skipped_count > 0:
-            print(
+            summary_lines.append(
                 f"Skipped {result.files_skipped_count} file(s) during content processing."
             )
         if result.token_count > 0:
-            print(f"Estimated token count (cl100k_base): {result.token_count}")
+            summary_lines.append(
+                f"Estimated token count (cl100k_base): {result.token_count}"
+            )
         else:
-            print(
+            summary_lines.append(
                 "Token count estimation failed or skipped (no content generated or tiktoken issue)."
             )
-        print("-" * 40)
+        summary_lines.append("-" * 40)
+        print("\n".join(summary_lines))
     else:
         print(f"\nError during compilation: {result.error_message}")
         sys.exit(1)
@@ -1,5 +1,87 @@
-from typing import Set
+import fnmatch
+import functools
+import os
+import re
+from typing import Callable, FrozenSet, Pattern, Set
+
+# Tests a bare file or directory name against a set of exclusion patterns.
+NameMatcher = Callable[[str], bool]
+
+# fnmatch.fnmatch folds case exactly when os.path.normcase does.
+_GLOB_FLAGS: int = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+
+
+def compile_glob(pattern: str) -> Pattern[str]:
+    """
+    Compiles a shell-style glob into a regex matching like `fnmatch.fnmatch`.
+
+    Use this when the same pattern is tested against many names: the
+    `.match` of the result avoids fnmatch's per-call normcase and cache lookup.
+
+    Args:
+        pattern: The glob pattern (e.g. 'config.compiled.*.yaml').
+
+    Returns:
+        The compiled pattern; `.match(name)` is truthy where
+        `fnmatch.fnmatch(name, pattern)` would be True.
+    """
+    return re.compile(fnmatch.translate(pattern), _GLOB_FLAGS)
+
+
+@functools.lru_cache(maxsize=32)
+def compile_name_matcher(patterns: FrozenSet[str]) -> NameMatcher:
+    """
+    Builds a matcher for names excluded by a set of names and glob patterns.
+
+    The result is equivalent to
+    `name in patterns or any(fnmatch.fnmatch(name, pat) for pat in patterns if '*' in pat or '?' in pat)`,
+    the check used for permanent exclusions, but all glob patterns are
+    compiled into a single regex so each name costs one set lookup and at
+    most one match. Results are cached, so callers may rebuild the matcher
+    for the same exclusions freely.
+
+    Args:
+        patterns: The exclusion names and patterns (e.g. {'.git', 'config.compiled.*.yaml'}).
+
+    Returns:
+        A function taking a file or directory name and returning True if it is excluded.
+    """
+    globs = sorted(pat for pat in patterns if '*' in pat or '?' in pat)
+    if not globs:
+        return patterns.__contains__
+    match_glob = re.compile('|'.join(fnmatch.translate(pat) for pat in globs), _GLOB_FLAGS).match
+    return lambda name: name in patterns or match_glob(name) is not None
+
 
 BASE_PERMANENT_EXCLUSIONS: Set[str] = {'.git'}
 CONFIG_FILE_PATTERN: str = 'config.compiled.*.yaml'
-DEFAULT_OUTPUT_BASENAME: str = "output.txt"
\ No newline at end of file
+# CONFIG_FILE_PATTERN compiled once, so callers need not re-translate the glob.
+CONFIG_FILE_REGEX: Pattern[str] = compile_glob(CONFIG_FILE_PATTERN)
+DEFAULT_OUTPUT_BASENAME: str = "output.txt"
+DEFAULT_OUTPUT_BASENAME_NO_EXT: str = os.path.splitext(DEFAULT_OUTPUT_BASENAME)[0]
+CONFIG_FILE_EXAMPLE: str = CONFIG_FILE_PATTERN.replace('*', 'myproject')
+
+
+def is_under(child: str, parent: str) -> bool:
+    """
+    Checks whether `child` is `parent` itself or lies somewhere below it.
+
+    Both paths must already be absolute and normalized; the test is then a
+    plain prefix comparison on `parent` plus a separator, which is far
+    cheaper than `os.path.commonpath` and never raises for paths on
+    different drives. Case is folded as `os.path.normcase` does.
+
+    Args:
+        child: The absolute path to test.
+        parent: The absolute directory path to test against.
+
+    Returns:
+        True if `child` equals `parent` or is inside it, False otherwise.
+    """
+    child = os.path.normcase(child)
+    parent = os.path.normcase(parent)
+    if child == parent:
+        return True
+    if not parent.endswith(os.sep):
+        parent += os.sep
+    return child.startswith(parent)
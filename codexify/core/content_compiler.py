@@ -1,27 +1,222 @@
 # File: codexify/core/content_compiler.py
 # ------------------------------------------------------------
+import io
 import os
-from typing import List, Dict, Optional, Tuple, Set, Any
+import shutil
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import groupby
+from operator import attrgetter
+from typing import AbstractSet, List, Dict, Optional, Tuple, Any, TextIO, Iterable, Iterator, Deque, Union
 
 from ..types import CompilationConfig
-from .file_system import is_likely_binary
+from .file_system import BINARY_PROBE_SIZE, is_binary_chunk
+from .go_utils import GoSourceFile
 
 # TreeDict is Dict[str, Any] as defined or implied in tree_builder.py
 TreeDict = Dict[str, Any]
 
-def assemble_compiled_content(
+# Separator lines used throughout the output, built once.
+_BLOCK_SEP = f"# {'=' * 70}\n"
+_SECTION_SEP = f"# {'-' * 70}\n"
+_FILE_SEP = f"# {'-' * 60}\n"
+_BLOCK_SEP_BLANK = _BLOCK_SEP + "\n"
+_SECTION_SEP_BLANK = _SECTION_SEP + "\n"
+_CONTENTS_HEADER = f"# === Compiled File Contents ===\n{_BLOCK_SEP_BLANK}"
+# Fixed tail of the local path tree header.
+_PATH_TREE_NOTES = (
+    "# (File content read with UTF-8 encoding, 'replace' error handling for decode issues)\n"
+    "# (Dirs/Files marked [Content Omitted] exist but their content is excluded based on rules/extensions)\n"
+    + _BLOCK_SEP
+)
+
+# Source files are copied into the output through a buffer of this size, so a
+# large file never has to be held in memory as a single string.
+_COPY_BUFFER_SIZE = 1 << 20
+
+# Environment variable overriding the number of read-ahead threads; set it to
+# 1 to read files sequentially (which can be faster on spinning disks).
+READ_THREADS_ENV_VAR = "CODEXIFY_READ_THREADS"
+
+
+def _read_worker_count() -> int:
+    """
+    Returns the read-ahead thread count from `READ_THREADS_ENV_VAR`, or a default based on the CPU count.
+
+    Looked up on every compilation, so the variable may be set or changed after import.
+    """
+    env_value = os.environ.get(READ_THREADS_ENV_VAR, "").strip()
+    if env_value:
+        try:
+            return max(1, int(env_value))
+        except ValueError:
+            print(f"Warning: Ignoring invalid {READ_THREADS_ENV_VAR} value '{env_value}'.")
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
+# Source files are read ahead by a small thread pool so several reads are in
+# flight while the output is written (the GIL is released during I/O). At most
+# _READ_AHEAD_PER_WORKER files per thread are pending at once, which also bounds
+# open descriptors; files larger than _COPY_BUFFER_SIZE are left to be streamed
+# by the writer. Fewer than _MIN_PARALLEL_READS files are not worth starting a
+# pool for.
+_READ_AHEAD_PER_WORKER = 2
+_MIN_PARALLEL_READS = 4
+
+# (is_binary, content, error) for one source file. Content and error are both
+# None when the file is too large to read ahead and must be streamed.
+FileReadResult = Tuple[bool, Optional[str], Optional[Exception]]
+
+
+def _sorted_csv(items: Iterable[str]) -> str:
+    """Joins `items` in sorted order with ', ', as shown in the output headers."""
+    return ', '.join(sorted(items))
+
+
+def _decode_source(data: Union[bytes, bytearray]) -> str:
+    """Decodes file bytes exactly as reading in text mode would (UTF-8, 'replace', universal newlines)."""
+    text = data.decode("utf-8", errors='replace')
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _read_source_file(abs_path: str, check_binary: bool) -> FileReadResult:
+    """
+    Reads one source file for `_read_ahead`; runs on a worker thread.
+
+    The file is opened once: when `check_binary` is set, its first bytes are
+    sniffed with `is_binary_chunk` and then reused as the start of the content.
+    As with `is_likely_binary`, a file that cannot be probed counts as binary.
+    """
+    try:
+        infile = open(abs_path, "rb")
+    except Exception as e_open:
+        if check_binary:
+            return True, None, None
+        return False, None, e_open
+    with infile:
+        head = b""
+        if check_binary:
+            try:
+                head = infile.read(BINARY_PROBE_SIZE)
+            except Exception:
+                return True, None, None
+            if is_binary_chunk(head):
+                return True, None, None
+        try:
+            size = os.fstat(infile.fileno()).st_size
+            if size > _COPY_BUFFER_SIZE:
+                return False, None, None
+            if check_binary and len(head) < BINARY_PROBE_SIZE:
+                data: Union[bytes, bytearray] = head  # The probe already read the whole file
+            elif head:
+                data = _read_after_head(infile, head, size)
+            else:
+                data = infile.read()
+        except Exception as e_read:
+            return False, None, e_read
+    return False, _decode_source(data), None
+
+
+def _read_after_head(infile: io.BufferedReader, head: bytes, size: int) -> bytearray:
+    """
+    Reads the rest of `infile` after its already-read `head`, into one buffer that starts with `head`.
+
+    The buffer is sized from the file's `size`, so the content is read in
+    place instead of being copied again by a `head + rest` concatenation.
+    Anything past `size` (a file still being written) is appended.
+    """
+    data = bytearray(max(size, len(head)))
+    data[:len(head)] = head
+    with memoryview(data)[len(head):] as rest_view:
+        filled = len(head) + infile.readinto(rest_view)
+    if filled < len(data):
+        del data[filled:]  # The file shrank after it was sized
+    else:
+        data += infile.read()  # A full buffer may not be the end of the file
+    return data
+
+
+def _read_ahead(abs_paths: List[str], check_binary: bool) -> Iterator[FileReadResult]:
+    """
+    Yields `_read_source_file` results for `abs_paths`, in order.
+
+    Reads are submitted to a pool of `_read_worker_count()` threads and kept
+    at most `_READ_AHEAD_PER_WORKER` files per thread ahead of the consumer.
+    Short lists, or a single configured worker, are simply read in place.
+    """
+    read_workers = _read_worker_count() if len(abs_paths) >= _MIN_PARALLEL_READS else 1
+    if read_workers < 2:
+        for abs_path in abs_paths:
+            yield _read_source_file(abs_path, check_binary)
+        return
+    read_ahead = read_workers * _READ_AHEAD_PER_WORKER
+    with ThreadPoolExecutor(max_workers=min(read_workers, len(abs_paths))) as pool:
+        pending: Deque["Future[FileReadResult]"] = deque()
+        remaining = iter(abs_paths)
+        for abs_path in remaining:
+            pending.append(pool.submit(_read_source_file, abs_path, check_binary))
+            if len(pending) >= read_ahead:
+                break
+        while pending:
+            result = pending.popleft().result()
+            next_path = next(remaining, None)
+            if next_path is not None:
+                pending.append(pool.submit(_read_source_file, next_path, check_binary))
+            yield result
+
+
+def _write_file_body(abs_path: str, content: Optional[str], out: TextIO) -> None:
+    """Writes content read ahead, or streams the file itself when there is none."""
+    if content is not None:
+        out.write(content)
+        return
+    with open(abs_path, "r", encoding="utf-8", errors='replace') as infile:
+        shutil.copyfileobj(infile, out, _COPY_BUFFER_SIZE)
+
+
+def _emit_file_content(
+    out: TextIO,
+    header_label: str,
+    abs_path: str,
+    content: Optional[str],
+    read_error: Optional[Exception]
+) -> Optional[Exception]:
+    """
+    Writes one file section (header, separator and body) for the contents block.
+
+    Shared by local path files and Go package files. `content` and `read_error`
+    come from `_read_ahead`.
+
+    Returns:
+        None if the body was written, otherwise the exception raised while
+        reading it. The caller writes the error note and counts the skip.
+    """
+    out.write(f"# File: {header_label}\n{_FILE_SEP}")
+    try:
+        if read_error is not None:
+            raise read_error
+        _write_file_body(abs_path, content, out)
+    except Exception as e_read:
+        return e_read
+    out.write("\n\n")
+    return None
+
+def write_compiled_content(
     config: CompilationConfig,
     root_abs_path: Optional[str],
     path_tree_lines: List[str],
     filtered_path_files: List[str],
     package_tree_lines_map: Dict[str, List[str]],
-    package_content_files: List[Dict[str, str]],
+    package_content_files: List[GoSourceFile],
     package_trees_map: Dict[str, TreeDict],
-    path_perm_excludes: Set[str],
-    go_perm_excludes: Set[str]
-) -> Tuple[str, int, int]:
+    path_perm_excludes: AbstractSet[str],
+    go_perm_excludes: AbstractSet[str],
+    out: TextIO
+) -> Tuple[int, int]:
     """
-    Assembles the final compiled text output from various components.
+    Writes the compiled text output, piece by piece, to a text stream.
 
     This function constructs the complete textual representation by:
     1.  Adding a header and the directory tree for the local project path, if processed.
@@ -47,9 +242,9 @@ def assemble_compiled_content(
                              whose content should be included from the local project.
         package_tree_lines_map: A dictionary mapping Go package import paths to lists
                                 of strings representing their formatted directory trees.
-        package_content_files: A list of dictionaries, each containing information
-                               about a Go source file to include (package name,
-                               relative path within the package, absolute path).
+        package_content_files: A list of `GoSourceFile` records, one per Go source
+                               file to include (package name, relative path
+                               within the package, absolute path).
         package_trees_map: A dictionary mapping Go package import paths to their
                            raw tree structure (TreeDict). Used to check
                            if a package tree was empty.
@@ -57,14 +252,17 @@ def assemble_compiled_content(
                             local path processing.
         go_perm_excludes: A set of patterns/names permanently excluded from
                           Go package processing.
+        out: The text stream (e.g. an open output file or `io.StringIO`) the
+             compiled text is written to. Source file contents are copied in
+             blocks, so memory use does not grow with the size of the project.
 
     Returns:
         A tuple containing:
-        -   `str`: The fully assembled compiled text.
         -   `int`: The total number of files whose content was successfully compiled.
         -   `int`: The total number of files skipped during content reading.
     """
-    output_content_parts: List[str] = []
+    write = out.write
+    root_display_name = (os.path.basename(root_abs_path) if root_abs_path != '.' else 'current_directory') if root_abs_path else ''
     files_compiled_count: int = 0
     files_skipped_count: int = 0
 
@@ -74,113 +272,137 @@ def assemble_compiled_content(
         gitignore_exists = bool(gitignore_path_abs and os.path.exists(gitignore_path_abs))
 
         gitignore_desc = f"using rules from '{gitignore_filename}'" if gitignore_filename and gitignore_exists else "no gitignore used"
-        user_exclude_dir_desc = f", user dir excludes: [{', '.join(sorted(config.exclude_dirs))}]" if config.exclude_dirs else ""
-        user_exclude_file_desc = f", user file excludes: [{', '.join(sorted(config.exclude_files))}]" if config.exclude_files else ""
-        permanent_path_excludes_str = ', '.join(sorted(list(path_perm_excludes)))
-        root_display_name = os.path.basename(root_abs_path) if root_abs_path != '.' else 'current_directory'
-
-        output_content_parts.append(f"# === Directory Tree for Local Path: '{root_display_name}' ===\n")
-        output_content_parts.append(f"# (Source: {root_abs_path})\n")
-        output_content_parts.append(f"# (Options: {gitignore_desc}{user_exclude_dir_desc}{user_exclude_file_desc})\n")
-        output_content_parts.append(f"# (Permanently Excluded: {permanent_path_excludes_str})\n")
-        output_content_parts.append("# (File content read with UTF-8 encoding, 'replace' error handling for decode issues)\n")
-        output_content_parts.append("# (Dirs/Files marked [Content Omitted] exist but their content is excluded based on rules/extensions)\n")
-        output_content_parts.append(f"# {'='*70}\n")
+        user_exclude_dir_desc = f", user dir excludes: [{_sorted_csv(config.exclude_dirs)}]" if config.exclude_dirs else ""
+        user_exclude_file_desc = f", user file excludes: [{_sorted_csv(config.exclude_files)}]" if config.exclude_files else ""
+        permanent_path_excludes_str = _sorted_csv(path_perm_excludes)
+
+        write(f"# === Directory Tree for Local Path: '{root_display_name}' ===\n")
+        write(f"# (Source: {root_abs_path})\n")
+        write(f"# (Options: {gitignore_desc}{user_exclude_dir_desc}{user_exclude_file_desc})\n")
+        write(f"# (Permanently Excluded: {permanent_path_excludes_str})\n")
+        write(_PATH_TREE_NOTES)
         if not path_tree_lines:
-            output_content_parts.append("# (Directory appears empty or all items were excluded)\n")
+            write("# (Directory appears empty or all items were excluded)\n")
         else:
             for line in path_tree_lines:
-                output_content_parts.append(f"# {line}\n")
-        output_content_parts.append(f"# {'='*70}\n\n")
+                write(f"# {line}\n")
+        write(_BLOCK_SEP_BLANK)
     elif config.project_path and not root_abs_path and config.verbose:
-        output_content_parts.append("# === Local Path processing was configured but root_abs_path was not resolved ===\n\n")
+        write("# === Local Path processing was configured but root_abs_path was not resolved ===\n\n")
     elif not config.project_path and config.verbose:
-        output_content_parts.append("# === No local path processed ===\n\n")
+        write("# === No local path processed ===\n\n")
 
 
     if package_tree_lines_map:
-        output_content_parts.append("# === Go Package Trees ===\n")
-        output_content_parts.append(f"# (Permanently Excluded: {', '.join(sorted(list(go_perm_excludes)))})\n")
-        output_content_parts.append(f"# {'='*70}\n\n")
-        for pkg_path_key in sorted(package_tree_lines_map.keys()):
-            output_content_parts.append(f"# --- Tree for Package: {pkg_path_key} ---\n")
-            output_content_parts.append(f"# {'-'*70}\n")
+        write("# === Go Package Trees ===\n")
+        write(f"# (Permanently Excluded: {_sorted_csv(go_perm_excludes)})\n")
+        write(_BLOCK_SEP_BLANK)
+        for pkg_path_key in sorted(package_tree_lines_map):
+            write(f"# --- Tree for Package: {pkg_path_key} ---\n")
+            write(_SECTION_SEP)
             current_pkg_tree: Optional[TreeDict] = package_trees_map.get(pkg_path_key)
             if not current_pkg_tree or not any(current_pkg_tree.values()):
-                 output_content_parts.append("# (Package directory seems empty or only contained excluded items)\n")
+                 write("# (Package directory seems empty or only contained excluded items)\n")
             else:
                 for line in package_tree_lines_map[pkg_path_key]:
-                    output_content_parts.append(f"# {line}\n")
-            output_content_parts.append(f"# {'-'*70}\n\n")
-        output_content_parts.append(f"# {'='*70}\n\n")
+                    write(f"# {line}\n")
+            write(_SECTION_SEP_BLANK)
+        write(_BLOCK_SEP_BLANK)
     elif config.go_packages and config.verbose:
-         output_content_parts.append("# === Go Package Trees (None Found or Processed) ===\n\n")
+         write("# === Go Package Trees (None Found or Processed) ===\n\n")
 
     has_path_content = bool(filtered_path_files)
     has_package_content = bool(package_content_files)
 
     if not has_path_content and not has_package_content:
-        output_content_parts.append("# === No files matched criteria for content compilation ===\n")
+        write("# === No files matched criteria for content compilation ===\n")
     else:
-        output_content_parts.append(f"# === Compiled File Contents ===\n# {'='*70}\n\n")
+        write(_CONTENTS_HEADER)
 
         if has_path_content and root_abs_path:
-            root_display_name = os.path.basename(root_abs_path) if root_abs_path != '.' else 'current_directory'
-            extensions_str = ', '.join(sorted(config.extensions)) if config.extensions else "any (if not otherwise excluded)"
-            output_content_parts.append(f"# --- Content from Path: '{root_display_name}' (Source: {root_abs_path}, Extensions: [{extensions_str}]) ---\n\n")
-            for file_rel in filtered_path_files:
-                file_abs_p = os.path.join(root_abs_path, file_rel.replace('/', os.sep))
-                if is_likely_binary(file_abs_p):
+            extensions_str = _sorted_csv(config.extensions) if config.extensions else "any (if not otherwise excluded)"
+            write(f"# --- Content from Path: '{root_display_name}' (Source: {root_abs_path}, Extensions: [{extensions_str}]) ---\n\n")
+            # File paths are clean and relative to root_abs_path, so joining is plain concatenation.
+            root_prefix = root_abs_path if root_abs_path.endswith(os.sep) else root_abs_path + os.sep
+            if os.sep == '/':
+                path_abs_files = [root_prefix + file_rel for file_rel in filtered_path_files]
+            else:
+                path_abs_files = [root_prefix + file_rel.replace('/', os.sep) for file_rel in filtered_path_files]
+            path_reads = _read_ahead(path_abs_files, check_binary=True)
+            for file_rel, file_abs_p, (is_binary, content, read_error) in zip(filtered_path_files, path_abs_files, path_reads):
+                if is_binary:
                     if config.verbose:
                         print(f"Skipping likely binary file from path: {file_rel}")
                     files_skipped_count += 1
                     continue
-                output_content_parts.append(f"# File: {file_rel}\n# {'-' * 60}\n")
-                try:
-                    with open(file_abs_p, "r", encoding="utf-8", errors='replace') as infile:
-                        content = infile.read()
-                    output_content_parts.append(content)
-                    output_content_parts.append("\n\n")
+                e_read = _emit_file_content(out, file_rel, file_abs_p, content, read_error)
+                if e_read is None:
                     files_compiled_count += 1
-                except FileNotFoundError:
-                    output_content_parts.append(f"# Error: File not found during content read '{file_abs_p}'.\n\n")
+                    continue
+                files_skipped_count += 1
+                if isinstance(e_read, FileNotFoundError):
+                    write(f"# Error: File not found during content read '{file_abs_p}'.\n\n")
                     if config.verbose:
                         print(f"Error: File listed for compilation not found: {file_abs_p}")
-                    files_skipped_count += 1
-                except Exception as e_read:
-                    output_content_parts.append(f"# Error reading file '{file_rel}': {e_read}.\n\n")
+                else:
+                    write(f"# Error reading file '{file_rel}': {e_read}.\n\n")
                     if config.verbose:
                         print(f"Error reading file {file_rel}: {e_read}")
-                    files_skipped_count += 1
-            output_content_parts.append("\n")
+            write("\n")
 
         if has_package_content:
-            output_content_parts.append("# --- Content from Go Packages ---\n\n")
-            current_pkg = None
-            for pkg_file_data in package_content_files:
-                pkg = pkg_file_data['package']
-                rel_path = pkg_file_data['relative_path']
-                abs_p = pkg_file_data['absolute_path']
-
-                if pkg != current_pkg:
-                    output_content_parts.append(f"# --- Package: {pkg} ---\n\n")
-                    current_pkg = pkg
-
-                output_content_parts.append(f"# File: package:{pkg}/{rel_path}\n# {'-' * 60}\n")
-                try:
-                    with open(abs_p, "r", encoding="utf-8", errors='replace') as infile:
-                        content = infile.read()
-                    output_content_parts.append(content)
-                    output_content_parts.append("\n\n")
-                    files_compiled_count += 1
-                except Exception as e_read_pkg:
-                    output_content_parts.append(f"# Error reading package file '{pkg}/{rel_path}': {e_read_pkg}.\n\n")
+            write("# --- Content from Go Packages ---\n\n")
+            package_reads = _read_ahead([pkg_file_data.absolute_path for pkg_file_data in package_content_files], check_binary=False)
+            # Files arrive sorted by package; one header is written per run of the same package.
+            for pkg, pkg_files in groupby(package_content_files, key=attrgetter('package')):
+                write(f"# --- Package: {pkg} ---\n\n")
+                # pkg_files comes first in zip, so a read result is only taken for a file of this package.
+                for pkg_file_data, (_, content, read_error) in zip(pkg_files, package_reads):
+                    rel_path = pkg_file_data.relative_path
+                    abs_p = pkg_file_data.absolute_path
+
+                    e_read_pkg = _emit_file_content(out, f"package:{pkg}/{rel_path}", abs_p, content, read_error)
+                    if e_read_pkg is None:
+                        files_compiled_count += 1
+                        continue
+                    write(f"# Error reading package file '{pkg}/{rel_path}': {e_read_pkg}.\n\n")
                     if config.verbose:
                         print(f"Error reading package file {pkg}/{rel_path}: {e_read_pkg}")
                     files_skipped_count += 1
 
     if files_skipped_count > 0:
-         output_content_parts.append(f"# {'='*70}\n# Note: {files_skipped_count} file(s) were skipped (e.g., binary, unreadable, not found during read).\n# {'='*70}\n")
+         write(f"{_BLOCK_SEP}# Note: {files_skipped_count} file(s) were skipped (e.g., binary, unreadable, not found during read).\n{_BLOCK_SEP}")
+
+    return files_compiled_count, files_skipped_count
+
 
-    full_output_text = "".join(output_content_parts)
-    return full_output_text, files_compiled_count, files_skipped_count
\ No newline at end of file
+def assemble_compiled_content(
+    config: CompilationConfig,
+    root_abs_path: Optional[str],
+    path_tree_lines: List[str],
+    filtered_path_files: List[str],
+    package_tree_lines_map: Dict[str, List[str]],
+    package_content_files: List[GoSourceFile],
+    package_trees_map: Dict[str, TreeDict],
+    path_perm_excludes: AbstractSet[str],
+    go_perm_excludes: AbstractSet[str]
+) -> Tuple[str, int, int]:
+    """
+    Assembles the final compiled text output from various components.
+
+    This is `write_compiled_content` collecting into an in-memory buffer;
+    see it for the layout of the output and a description of the arguments.
+
+    Returns:
+        A tuple containing:
+        -   `str`: The fully assembled compiled text.
+        -   `int`: The total number of files whose content was successfully compiled.
+        -   `int`: The total number of files skipped during content reading.
+    """
+    buffer = io.StringIO()
+    files_compiled_count, files_skipped_count = write_compiled_content(
+        config, root_abs_path, path_tree_lines, filtered_path_files,
+        package_tree_lines_map, package_content_files, package_trees_map,
+        path_perm_excludes, go_perm_excludes, buffer
+    )
+    return buffer.getvalue(), files_compiled_count, files_skipped_count
\ No newline at end of file
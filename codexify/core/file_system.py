@@ -1,11 +1,58 @@
 # codexify/core/file_system.py
+import functools
 import os
-import fnmatch
-from typing import Optional, Tuple, Set, List, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import AbstractSet, Optional, Tuple, List, Callable
+
+from .common import NameMatcher, compile_name_matcher
 
 GitignoreMatcher = Callable[[str], bool]
 ParseGitignoreFuncType = Callable[[str, Optional[str]], GitignoreMatcher]
 
+# Number of path verdicts remembered by each matcher returned from load_gitignore.
+_GITIGNORE_MATCH_CACHE_SIZE = 65536
+
+
+def ignore_nothing(path_to_check: str) -> bool:
+    """
+    The matcher used when no gitignore file is loaded.
+
+    `load_gitignore` returns this very function in that case, so callers may
+    test `matcher is ignore_nothing` and skip the per-path calls altogether.
+    """
+    return False
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_gitignore_cached(
+    gitignore_file_abs_path: str,
+    parse_gitignore_func: ParseGitignoreFuncType,
+    base_dir_for_rules_interpretation: Optional[str],
+    mtime_ns: int,
+    size: int,
+) -> GitignoreMatcher:
+    """
+    Parses a gitignore file into a matcher that caches its verdicts per path.
+
+    Results are memoized on the file's modification time and size as well as
+    its path, so an edited gitignore file is parsed again. Parse errors are
+    raised to the caller and not cached.
+    """
+    # base_dir_for_rules_interpretation is crucial.
+    # It tells parse_gitignore where the rules like `/build` or `src/`
+    # should be anchored. This should be the root of the project being scanned.
+    rules_matcher: GitignoreMatcher = parse_gitignore_func(
+        gitignore_file_abs_path,  # Path to the actual .gitignore file
+        base_dir_for_rules_interpretation,  # Base for interpreting rules within that file
+    )
+
+    # The matcher returned by parse_gitignore typically expects absolute paths to check.
+    @functools.lru_cache(maxsize=_GITIGNORE_MATCH_CACHE_SIZE)
+    def cached_matcher(path_to_check: str) -> bool:
+        return rules_matcher(os.path.abspath(path_to_check))
+
+    return cached_matcher
+
 
 def load_gitignore(
     gitignore_file_abs_path: Optional[
@@ -32,23 +79,26 @@ def load_gitignore(
 
     Returns:
         A function that takes an absolute file path and returns True if
-        the path matches any ignore rule, False otherwise. If no gitignore
-        file is loaded or found, it returns a function that always returns False.
+        the path matches any ignore rule, False otherwise. Verdicts are cached
+        per path string (call its `cache_clear()` to reset), and the same
+        matcher is returned again while the gitignore file is unchanged. If no
+        gitignore file is loaded or found, it returns `ignore_nothing`, which
+        always returns False.
     """
     if gitignore_file_abs_path:
         # gitignore_file_abs_path is already absolute as per parameter name
-        if os.path.exists(gitignore_file_abs_path):
+        try:
+            gitignore_stat: Optional[os.stat_result] = os.stat(gitignore_file_abs_path)
+        except OSError:
+            gitignore_stat = None
+        if gitignore_stat is not None:
             try:
-                # base_dir_for_rules_interpretation is crucial.
-                # It tells parse_gitignore where the rules like `/build` or `src/`
-                # should be anchored. This should be the root of the project being scanned.
-                rules_matcher: GitignoreMatcher = parse_gitignore_func(
-                    gitignore_file_abs_path,  # Path to the actual .gitignore file
-                    base_dir_for_rules_interpretation,  # Base for interpreting rules within that file
-                )
-                # The matcher returned by parse_gitignore typically expects absolute paths to check.
-                return lambda path_to_check: rules_matcher(
-                    os.path.abspath(path_to_check)
+                return _parse_gitignore_cached(
+                    gitignore_file_abs_path,
+                    parse_gitignore_func,
+                    base_dir_for_rules_interpretation,
+                    gitignore_stat.st_mtime_ns,
+                    gitignore_stat.st_size,
                 )
             except Exception as e:
                 print(
@@ -56,16 +106,59 @@ def load_gitignore(
                 )
         else:
             print(f"Warning: gitignore file '{gitignore_file_abs_path}' not found.")
-    return lambda path_to_check: False  # No gitignore, so ignore nothing
+    return ignore_nothing  # No gitignore, so ignore nothing
+
+
+# Number of leading bytes inspected to decide whether a file is binary.
+BINARY_PROBE_SIZE = 1024
+
+# Number of is_likely_binary verdicts remembered, keyed on path, mtime and size.
+_BINARY_PROBE_CACHE_SIZE = 65536
 
 
 # ... (is_likely_binary, get_parent_folder_name, count_contents remain the same)
+def is_binary_chunk(chunk: bytes) -> bool:
+    """
+    Checks if the leading bytes of a file look like binary data.
+
+    This is the test behind `is_likely_binary`, for callers that have already
+    read the first `BINARY_PROBE_SIZE` bytes of a file themselves.
+
+    Args:
+        chunk: Up to `BINARY_PROBE_SIZE` bytes from the start of the file.
+
+    Returns:
+        True if the chunk contains a null byte or is not valid UTF-8.
+    """
+    if b"\x00" in chunk:
+        return True
+    if chunk.isascii():
+        return False  # Pure ASCII is valid UTF-8; skip the decoder
+    try:
+        chunk.decode("utf-8", errors="strict")
+    except UnicodeDecodeError:
+        return True
+    return False
+
+
+@functools.lru_cache(maxsize=_BINARY_PROBE_CACHE_SIZE)
+def _probe_file(file_path: str, mtime_ns: int, size: int) -> bool:
+    """Reads and tests the head of a file for `is_likely_binary`; read errors are raised, not cached."""
+    # Unbuffered: a single small read needs no BufferedReader (and its 8 KiB buffer) in between.
+    with open(file_path, "rb", buffering=0) as f:
+        chunk = f.read(BINARY_PROBE_SIZE)
+    return is_binary_chunk(chunk)
+
+
 def is_likely_binary(file_path: str) -> bool:
     """
     Checks if a file is likely a binary file.
 
     It reads a small chunk of the file and checks for null bytes or
     decoding errors with UTF-8, which are common indicators of binary files.
+    The verdict is cached per path and only recomputed once the file's
+    modification time or size changes, so repeated runs in one process
+    cost a single stat per unchanged file.
 
     Args:
         file_path: The path to the file to check.
@@ -74,20 +167,27 @@ def is_likely_binary(file_path: str) -> bool:
         True if the file is likely binary, False otherwise.
     """
     try:
-        with open(file_path, "rb") as f:
-            chunk = f.read(1024)
-        if b"\x00" in chunk:
-            return True
-        chunk.decode("utf-8", errors="strict")
-        return False
-    except UnicodeDecodeError:
-        return True
+        file_stat = os.stat(file_path)
+        if file_stat.st_size == 0:
+            return False  # An empty file reads as an empty, text-like chunk; no need to open it
+        return _probe_file(file_path, file_stat.st_mtime_ns, file_stat.st_size)
     except (
         Exception
     ):  # Catches other potential errors like permission denied during read
         return True  # Treat as binary if unreadable for safety
 
 
+def clear_caches() -> None:
+    """
+    Drops the parsed gitignore files and the binary-probe verdicts kept by this module.
+
+    Both are kept across runs on purpose, keyed on each file's modification
+    time and size, so callers only need this to release their memory.
+    """
+    _parse_gitignore_cached.cache_clear()
+    _probe_file.cache_clear()
+
+
 def get_parent_folder_name(path_str: Optional[str]) -> Optional[str]:
     """
     Extracts the name of the immediate parent folder from a given path string.
@@ -116,7 +216,71 @@ def get_parent_folder_name(path_str: Optional[str]) -> Optional[str]:
         return None
 
 
-def count_contents(start_path: str, permanent_exclusions: Set[str]) -> Tuple[int, int]:
+# count_contents counts the subtrees below its start directory on up to this
+# many threads, once there are at least _MIN_PARALLEL_SUBTREES of them.
+_COUNT_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+_MIN_PARALLEL_SUBTREES = 4
+
+
+def _scan_for_count(dir_path: str, is_excluded: NameMatcher) -> Tuple[int, int, List[str]]:
+    """
+    Counts the non-excluded entries of a single directory for `count_contents`.
+
+    Entry types come from the directory listing itself, so no extra stat is
+    made per entry. Counting matches os.walk(): symlinks to directories count
+    as directories but are not descended into. An unreadable directory counts
+    as empty.
+
+    Returns:
+        A tuple (dir_count, file_count, subdirs), where `subdirs` are the
+        paths of the counted directories to descend into.
+    """
+    dir_count: int = 0
+    file_count: int = 0
+    subdirs: List[str] = []
+    try:
+        entries = os.scandir(dir_path)
+    except OSError:
+        # print(f"Warning: Could not count contents of '{dir_path}' due to an OS error: {e}")
+        return 0, 0, subdirs  # Fail silently for counting if path is inaccessible
+    with entries:
+        try:
+            for entry in entries:
+                if is_excluded(entry.name):
+                    continue
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    file_count += 1
+                    continue
+                dir_count += 1
+                try:
+                    is_symlink = entry.is_symlink()
+                except OSError:
+                    is_symlink = False
+                if not is_symlink:
+                    subdirs.append(entry.path)
+        except OSError:
+            pass  # Listing failed part-way; keep what was counted, as os.walk does
+    return dir_count, file_count, subdirs
+
+
+def _count_subtree(dir_path: str, is_excluded: NameMatcher) -> Tuple[int, int]:
+    """Counts the non-excluded directories and files below `dir_path`, iteratively."""
+    dir_count: int = 0
+    file_count: int = 0
+    dirs_to_scan: List[str] = [dir_path]
+    while dirs_to_scan:
+        sub_dir_count, sub_file_count, subdirs = _scan_for_count(dirs_to_scan.pop(), is_excluded)
+        dir_count += sub_dir_count
+        file_count += sub_file_count
+        dirs_to_scan.extend(subdirs)
+    return dir_count, file_count
+
+
+def count_contents(start_path: str, permanent_exclusions: AbstractSet[str]) -> Tuple[int, int]:
     """
     Counts the number of subdirectories and files under a given path,
     respecting permanent exclusions.
@@ -135,41 +299,18 @@ def count_contents(start_path: str, permanent_exclusions: Set[str]) -> Tuple[int
         A tuple (dir_count, file_count) representing the number of
         non-excluded subdirectories and files found.
     """
-    dir_count: int = 0
-    file_count: int = 0
-    perm_exclude_set_str: Set[str] = permanent_exclusions  # For clarity
-
-    try:
-        for _, dirnames, filenames in os.walk(start_path, topdown=True):
-            dirs_to_traverse: List[str] = []
-            for d_name in dirnames:
-                # Basic name check first, then pattern check
-                if d_name in perm_exclude_set_str or any(
-                    fnmatch.fnmatch(d_name, pat)
-                    for pat in perm_exclude_set_str
-                    if "*" in pat or "?" in pat
-                ):
-                    continue
-                dirs_to_traverse.append(d_name)
-
-            dir_count += len(dirs_to_traverse)
-            dirnames[:] = (
-                dirs_to_traverse  # Modify dirnames in place to control traversal
-            )
-
-            for f_name in filenames:
-                if f_name in perm_exclude_set_str or any(
-                    fnmatch.fnmatch(f_name, pat)
-                    for pat in perm_exclude_set_str
-                    if "*" in pat or "?" in pat
-                ):
-                    continue
-                file_count += 1
-    except OSError:
-        # print(f"Warning: Could not count contents of '{start_path}' due to an OS error: {e}")
-        pass  # Fail silently for counting if path is inaccessible
-    except Exception:
-        # print(f"Warning: An unexpected error occurred while counting contents of '{start_path}': {e_general}")
-        pass
+    # Name check and all glob patterns in one compiled matcher, built once per exclusion set
+    is_excluded = compile_name_matcher(frozenset(permanent_exclusions))
 
+    dir_count, file_count, subdirs = _scan_for_count(start_path, is_excluded)
+    count_subtree = functools.partial(_count_subtree, is_excluded=is_excluded)
+    if len(subdirs) < _MIN_PARALLEL_SUBTREES:
+        subtree_counts = list(map(count_subtree, subdirs))
+    else:
+        # Directory listing releases the GIL, so top-level subtrees are counted concurrently.
+        with ThreadPoolExecutor(max_workers=min(_COUNT_WORKERS, len(subdirs))) as pool:
+            subtree_counts = list(pool.map(count_subtree, subdirs))
+    for sub_dir_count, sub_file_count in subtree_counts:
+        dir_count += sub_dir_count
+        file_count += sub_file_count
     return dir_count, file_count
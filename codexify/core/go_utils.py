@@ -2,12 +2,28 @@
 # ------------------------------------------------------------
 import os
 import subprocess
-from typing import List, Dict, Optional, Sequence, Union # Added Union
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from typing import Iterable, Iterator, List, Dict, NamedTuple, Optional, Sequence, Union # Added Union
 import shutil
 
 from ..types import CompilationConfig
 from .file_system import is_likely_binary
 
+class GoSourceFile(NamedTuple):
+    """
+    A Go source file selected for content compilation.
+
+    Attributes:
+        package: The original Go package import path.
+        relative_path: The file's path relative to its package root, using forward slashes.
+        absolute_path: The absolute path to the `.go` file on disk.
+    """
+    package: str
+    relative_path: str
+    absolute_path: str
+
+
 def _format_command_for_display(cmd_attr: Union[str, Sequence[str]]) -> str:
     """Helper to format a command attribute for display."""
     if isinstance(cmd_attr, str):
@@ -17,13 +33,63 @@ def _format_command_for_display(cmd_attr: Union[str, Sequence[str]]) -> str:
     return ' '.join(str(arg) for arg in cmd_attr)
 
 
+# Go source files are checked with is_likely_binary on up to this many threads,
+# for packages with at least _MIN_PARALLEL_PROBES candidate files.
+_PROBE_WORKERS = min(16, (os.cpu_count() or 1) * 4)
+_MIN_PARALLEL_PROBES = 8
+
+# Arguments that `go list` expands to any number of packages; a batched call
+# cannot map its output lines back to the requested paths when one is present.
+_GO_LIST_META_PACKAGES = frozenset({"all", "std", "cmd", "tool"})
+
+
+def _locate_go_packages_batched(config: CompilationConfig, go_cmd_path: str, package_paths: List[str], go_list_cwd: str) -> Optional[Dict[str, str]]:
+    """
+    Resolves all package directories with a single 'go list' invocation.
+
+    Without `-e`, 'go list' prints nothing when any package fails to load, so
+    output is only used when the command succeeds and prints exactly one
+    directory per requested path, in order.
+
+    Returns:
+        The package locations, or None if the paths could not be resolved in
+        one batch (wildcards, duplicates, any failing package), in which case
+        the caller locates the packages one by one.
+    """
+    if len(package_paths) < 2 or len(set(package_paths)) != len(package_paths):
+        return None
+    if any("..." in pkg_path or pkg_path in _GO_LIST_META_PACKAGES for pkg_path in package_paths):
+        return None
+    try:
+        result = subprocess.run([go_cmd_path, "list", "-f", "{{.Dir}}"] + package_paths, capture_output=True, text=True, encoding='utf-8', cwd=go_list_cwd)
+    except Exception:
+        return None
+    pkg_dirs = result.stdout.splitlines()
+    if result.returncode != 0 or len(pkg_dirs) != len(package_paths):
+        return None
+
+    package_locations: Dict[str, str] = {}
+    for pkg_path, pkg_dir in zip(package_paths, pkg_dirs):
+        pkg_dir = pkg_dir.strip()
+        if config.verbose:
+            print(f"  Locating package: {pkg_path}")
+        if not pkg_dir or not os.path.isdir(pkg_dir):
+            print(f"    Warning: Could not find valid directory for package '{pkg_path}'. 'go list' returned: '{pkg_dir}'. Skipping.")
+            continue
+        if config.verbose:
+            print(f"    Found at: {pkg_dir}")
+        package_locations[pkg_path] = pkg_dir
+    return package_locations
+
+
 def get_go_package_locations(config: CompilationConfig, package_paths: List[str], project_root_for_go_mod: Optional[str]) -> Dict[str, str]:
     """
     Finds the on-disk locations of specified Go packages using 'go list'.
 
     This function attempts to resolve each Go package import path to its
     corresponding directory on the filesystem. It uses the 'go list'
-    command for this purpose.
+    command for this purpose: all packages are first resolved in a single
+    invocation, falling back to one invocation per package if that fails.
 
     Args:
         config: The `CompilationConfig` object, used for `verbose` logging.
@@ -84,6 +150,13 @@ def get_go_package_locations(config: CompilationConfig, package_paths: List[str]
             print("Skipping all Go package processing.")
         return {}
 
+    batched_locations = _locate_go_packages_batched(config, go_cmd_path, package_paths, go_list_cwd)
+    if batched_locations is not None:
+        package_locations = batched_locations
+        if not package_locations and config.verbose:
+            print("No Go package locations were successfully found.")
+        return package_locations
+
     for pkg_path in package_paths:
         if config.verbose:
             print(f"  Locating package: {pkg_path}")
@@ -111,7 +184,40 @@ def get_go_package_locations(config: CompilationConfig, package_paths: List[str]
     return package_locations
 
 
-def get_go_package_content_files(config: CompilationConfig, package_locations: Dict[str, str]) -> List[Dict[str, str]]:
+def _iter_go_source_paths(pkg_dir: str) -> Iterator[str]:
+    """
+    Yields the paths of the `.go` files below `pkg_dir`, skipping `.git` directories.
+
+    The walk uses an `os.scandir` stack, so directories named '.git' are pruned
+    by name before they are listed, and only names ending in '.go' are passed
+    on for the binary check. As with `os.walk`, symlinked directories are not
+    descended into and unreadable directories are skipped silently.
+    """
+    if '.git' in pkg_dir.split(os.sep):
+        return
+    dirs_to_scan: List[str] = [pkg_dir]
+    while dirs_to_scan:
+        try:
+            entries = os.scandir(dirs_to_scan.pop())
+        except OSError:
+            continue
+        with entries:
+            try:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if entry.name != '.git' and not entry.is_symlink():
+                            dirs_to_scan.append(entry.path)
+                    elif entry.name.lower().endswith(".go"):
+                        yield entry.path
+            except OSError:
+                continue
+
+
+def get_go_package_content_files(config: CompilationConfig, package_locations: Dict[str, str]) -> List[GoSourceFile]:
     """
     Collects .go source files from the specified Go package directories.
 
@@ -126,43 +232,43 @@ def get_go_package_content_files(config: CompilationConfig, package_locations: D
                            `get_go_package_locations`).
 
     Returns:
-        A list of dictionaries. Each dictionary represents a `.go` file and contains:
-        -   'package': The original Go package import path.
-        -   'relative_path': The file's path relative to its package root,
-                             using forward slashes.
-        -   'absolute_path': The absolute path to the `.go` file on disk.
-        The list is sorted by package name and then by relative path.
+        A list of `GoSourceFile` records (package, relative_path, absolute_path),
+        one per `.go` file, sorted by package name and then by relative path.
     """
-    package_content_files: List[Dict[str, str]] = []
+    package_content_files: List[GoSourceFile] = []
     if config.verbose:
         print("Collecting Go package source files for compilation...")
 
-    for pkg_path, pkg_dir in package_locations.items():
-        if not pkg_dir or not os.path.isdir(pkg_dir):
+    # Binary probes are small reads that release the GIL; a pool keeps several in
+    # flight. Its threads are only started once a package has enough files.
+    with ThreadPoolExecutor(max_workers=_PROBE_WORKERS) as probe_pool:
+        for pkg_path, pkg_dir in package_locations.items():
+            if not pkg_dir or not os.path.isdir(pkg_dir):
+                if config.verbose:
+                    print(f"  Skipping package '{pkg_path}' due to invalid directory: {pkg_dir}")
+                continue
             if config.verbose:
-                print(f"  Skipping package '{pkg_path}' due to invalid directory: {pkg_dir}")
-            continue
-        if config.verbose:
-            print(f"  Scanning package: {pkg_path} (in {pkg_dir})")
+                print(f"  Scanning package: {pkg_path} (in {pkg_dir})")
 
-        for dirpath, _, filenames in os.walk(pkg_dir):
-            if '.git' in dirpath.split(os.sep):
-                continue
-            for filename_str in filenames:
-                if filename_str.lower().endswith(".go"):
-                    file_abs_path = os.path.join(dirpath, filename_str)
-                    if is_likely_binary(file_abs_path):
-                        if config.verbose:
-                            print(f"    Skipping likely binary file in package '{pkg_path}': {filename_str}")
-                        continue
-                    rel_path = os.path.relpath(file_abs_path, pkg_dir).replace(os.sep, '/')
-                    package_content_files.append({
-                        'package': pkg_path,
-                        'relative_path': rel_path,
-                        'absolute_path': file_abs_path
-                    })
-
-    package_content_files.sort(key=lambda x_file: (x_file['package'], x_file['relative_path']))
+            # Walked paths all start with the package directory, so the relative path is a slice.
+            pkg_dir_prefix = pkg_dir if pkg_dir.endswith(os.sep) else pkg_dir + os.sep
+            go_file_paths = list(_iter_go_source_paths(pkg_dir))
+            binary_flags: Iterable[bool]
+            if len(go_file_paths) < _MIN_PARALLEL_PROBES:
+                binary_flags = map(is_likely_binary, go_file_paths)
+            else:
+                binary_flags = probe_pool.map(is_likely_binary, go_file_paths)
+            for file_abs_path, is_binary in zip(go_file_paths, binary_flags):
+                if is_binary:
+                    if config.verbose:
+                        print(f"    Skipping likely binary file in package '{pkg_path}': {os.path.basename(file_abs_path)}")
+                    continue
+                rel_path = file_abs_path[len(pkg_dir_prefix):]
+                if os.sep != '/':
+                    rel_path = rel_path.replace(os.sep, '/')
+                package_content_files.append(GoSourceFile(pkg_path, rel_path, file_abs_path))
+
+    package_content_files.sort(key=attrgetter('package', 'relative_path'))
     if config.verbose:
         print(f"Found {len(package_content_files)} Go source files in packages for compilation.")
     return package_content_files
\ No newline at end of file
@@ -1,10 +1,12 @@
 # File: codexify/core/tree_builder.py
+import functools
 import os
-import fnmatch
-from typing import List, Dict, Optional, Set, Any, Tuple, Union, cast
+from typing import AbstractSet, FrozenSet, Iterator, List, Dict, Optional, Set, Any, Tuple, Union, cast
 
+from .common import compile_glob, compile_name_matcher
 from .file_system import (
     load_gitignore,
+    ignore_nothing,
     count_contents,
     ParseGitignoreFuncType,
     GitignoreMatcher,
@@ -14,6 +16,81 @@ TreeDict = Dict[str, Any]
 FileEntry = Dict[str, Union[str, bool]]
 
 
+def _walk_tree(abs_root: str) -> Iterator[Tuple[str, List[str], List[str]]]:
+    """
+    Walks `abs_root` like a top-down `os.walk`, built directly on `os.scandir`.
+
+    Yields the same `(dirpath, dirnames, filenames)` triples in the same order,
+    and the caller may prune `dirnames` in place to control the descent.
+    Directory symlinks are listed but not followed, as with os.walk; whether
+    an entry is a symlink comes from the directory listing, so no `lstat` is
+    made per descended directory. Unreadable directories are skipped silently.
+    """
+    dirs_to_walk: List[str] = [abs_root]
+    while dirs_to_walk:
+        dirpath = dirs_to_walk.pop()
+        try:
+            entries = os.scandir(dirpath)
+        except OSError:
+            continue
+        dirnames: List[str] = []
+        filenames: List[str] = []
+        symlinked_dirnames: Set[str] = set()
+        with entries:
+            try:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        filenames.append(entry.name)
+                        continue
+                    dirnames.append(entry.name)
+                    try:
+                        if entry.is_symlink():
+                            symlinked_dirnames.add(entry.name)
+                    except OSError:
+                        pass
+            except OSError:
+                continue  # As os.walk: a listing that fails part-way is not yielded
+        yield dirpath, dirnames, filenames
+        # Pushed in reverse so subdirectories are walked depth-first in dirnames order.
+        dir_prefix = dirpath if dirpath.endswith(os.sep) else dirpath + os.sep
+        dirs_to_walk.extend(dir_prefix + d_name for d_name in reversed(dirnames) if d_name not in symlinked_dirnames)
+
+
+@functools.lru_cache(maxsize=32)
+def _split_extension_patterns(
+    extensions: FrozenSet[str],
+) -> Tuple[FrozenSet[str], Tuple[str, ...]]:
+    """
+    Splits content "extensions" into exact file names and file name suffixes.
+
+    '.py' is a suffix, 'Makefile' matches both the name 'makefile' and the
+    suffix '.makefile', and a dotted name such as 'go.mod' matches exactly.
+    All patterns are lowercased, to be tested against lowercased file names.
+    Results are cached, as the same extensions are split for every tree built.
+
+    Returns:
+        A tuple (exact_match_patterns, suffix_match_tuple). The suffixes are
+        a tuple so a name is tested against all of them with one `str.endswith`.
+    """
+    exact_match_patterns: Set[str] = set()
+    suffix_match_patterns: Set[str] = set()
+
+    for ext_input in extensions:
+        ext_lower = ext_input.lower()
+        if ext_lower.startswith("."):
+            suffix_match_patterns.add(ext_lower)
+        elif "." not in ext_lower:
+            exact_match_patterns.add(ext_lower)
+            suffix_match_patterns.add("." + ext_lower)
+        else:
+            exact_match_patterns.add(ext_lower)
+    return frozenset(exact_match_patterns), tuple(suffix_match_patterns)
+
+
 def build_filtered_file_list(
     root: str,  # This is the current scan root (e.g., project_path or Go package dir)
     extensions: List[str],
@@ -21,7 +98,7 @@ def build_filtered_file_list(
     exclude_files: List[str],
     gitignore_file_abs_path: Optional[str],  # Expecting absolute path from CLI/main
     parse_gitignore_func: ParseGitignoreFuncType,
-    permanent_exclusions: Set[str],
+    permanent_exclusions: AbstractSet[str],
     config_pattern_yaml_local: str,
 ) -> List[str]:
     """
@@ -34,21 +111,13 @@ def build_filtered_file_list(
         gitignore_file_abs_path: Absolute path to a .gitignore file to use.
         # ...
     """
-    exact_match_patterns: Set[str] = set()
-    suffix_match_patterns: Set[str] = set()
-
-    for ext_input in extensions:
-        ext_lower = ext_input.lower()
-        if ext_lower.startswith("."):
-            suffix_match_patterns.add(ext_lower)
-        elif "." not in ext_lower:
-            exact_match_patterns.add(ext_lower)
-            suffix_match_patterns.add("." + ext_lower)
-        else:
-            exact_match_patterns.add(ext_lower)
+    exact_match_patterns, suffix_match_tuple = _split_extension_patterns(frozenset(extensions))
 
     file_list: List[str] = []
     abs_root = os.path.abspath(root)  # Key: base for rule interpretation
+    # _walk_tree yields abs_root and normalized absolute paths below it, so the
+    # relative path of a directory is a slice off this prefix.
+    root_prefix = abs_root if abs_root.endswith(os.sep) else abs_root + os.sep
 
     # MODIFICATION: gitignore_file_abs_path is passed directly.
     # base_dir_for_rules_interpretation is abs_root.
@@ -57,14 +126,19 @@ def build_filtered_file_list(
         parse_gitignore_func,
         abs_root,  # Rules in the gitignore are interpreted relative to this scan root
     )
+    # No gitignore loaded: skip the matcher calls rather than make one per path.
+    use_gitignore: bool = ignore_matcher is not ignore_nothing
 
-    exclude_dirs_set: Set[str] = set(exclude_dirs)
-    exclude_files_set: Set[str] = set(exclude_files)
-    perm_exclude_set: Set[str] = permanent_exclusions
+    exclude_dirs_set: FrozenSet[str] = frozenset(exclude_dirs)
+    exclude_files_set: FrozenSet[str] = frozenset(exclude_files)
+    perm_exclude_set: FrozenSet[str] = frozenset(permanent_exclusions)
+    is_perm_excluded_file = compile_name_matcher(perm_exclude_set)
+    match_config_pattern = compile_glob(config_pattern_yaml_local).match
 
-    for dirpath, dirnames, filenames in os.walk(abs_root, topdown=True):
+    for abs_dirpath, dirnames, filenames in _walk_tree(abs_root):
         # ... (rest of the function remains the same as your "production ready" version)
-        abs_dirpath = os.path.abspath(dirpath)
+        at_root = abs_dirpath == abs_root
+        dir_prefix = root_prefix if at_root else abs_dirpath + os.sep
 
         original_dirnames = list(dirnames)
         dirnames[:] = []
@@ -73,44 +147,31 @@ def build_filtered_file_list(
                 continue
             if d_name in exclude_dirs_set:
                 continue
-            abs_subdir_path = os.path.join(abs_dirpath, d_name)
-            if ignore_matcher(abs_subdir_path):
+            if use_gitignore and ignore_matcher(dir_prefix + d_name):
                 continue
             dirnames.append(d_name)
 
-        rel_dirpath = os.path.relpath(abs_dirpath, abs_root)
+        rel_dir_prefix = "" if at_root else abs_dirpath[len(root_prefix) :] + os.sep
 
         for filename_str in filenames:
-            if filename_str in perm_exclude_set or any(
-                fnmatch.fnmatch(filename_str, pat)
-                for pat in perm_exclude_set
-                if "*" in pat or "?" in pat
-            ):
+            if is_perm_excluded_file(filename_str):
                 continue
-            if fnmatch.fnmatch(filename_str, config_pattern_yaml_local):
+            if match_config_pattern(filename_str):
                 continue
             if filename_str in exclude_files_set:
                 continue
 
-            full_path = os.path.join(abs_dirpath, filename_str)
-            if ignore_matcher(full_path):
-                continue
-
-            fn_lower = filename_str.lower()
+            # Most source file names are lowercase already; islower() spares the copy.
+            fn_lower = filename_str if filename_str.islower() else filename_str.lower()
             matched = False
             if fn_lower in exact_match_patterns:
                 matched = True
-            if not matched and any(
-                fn_lower.endswith(s_ext) for s_ext in suffix_match_patterns
-            ):
+            if not matched and fn_lower.endswith(suffix_match_tuple):
                 matched = True
 
-            if matched:
-                rel_path_intermediate = (
-                    os.path.join(rel_dirpath, filename_str)
-                    if rel_dirpath != "."
-                    else filename_str
-                )
+            # The gitignore rules are the costliest test, so they come last.
+            if matched and not (use_gitignore and ignore_matcher(dir_prefix + filename_str)):
+                rel_path_intermediate = rel_dir_prefix + filename_str
                 rel_path_normalized = rel_path_intermediate.replace(os.sep, "/")
                 file_list.append(rel_path_normalized)
     file_list.sort()
@@ -122,7 +183,7 @@ def build_tree_structure(
     use_gitignore: bool,  # Still useful to conditionally apply gitignore logic
     gitignore_file_abs_path: Optional[str],  # Expecting absolute path from CLI/main
     parse_gitignore_func: ParseGitignoreFuncType,
-    permanent_exclusions: Set[str],
+    permanent_exclusions: AbstractSet[str],
     user_exclude_dirs: List[str],
     user_exclude_files: List[str],
     extensions_for_content: List[str],
@@ -136,10 +197,82 @@ def build_tree_structure(
         gitignore_file_abs_path: Absolute path to a .gitignore file.
         # ...
     """
+    tree, _ = _build_tree(
+        root,
+        use_gitignore,
+        gitignore_file_abs_path,
+        parse_gitignore_func,
+        permanent_exclusions,
+        user_exclude_dirs,
+        user_exclude_files,
+        extensions_for_content,
+        None,
+    )
+    return tree
+
+
+def build_tree_and_file_list(
+    root: str,
+    extensions: List[str],
+    exclude_dirs: List[str],
+    exclude_files: List[str],
+    gitignore_file_abs_path: Optional[str],  # Expecting absolute path from CLI/main
+    parse_gitignore_func: ParseGitignoreFuncType,
+    permanent_exclusions: AbstractSet[str],
+    config_pattern_yaml_local: str,
+) -> Tuple[TreeDict, List[str]]:
+    """
+    Builds the directory tree and the filtered file list of `root` in a single walk.
+
+    The result equals that of `build_tree_structure(root, True, gitignore_file_abs_path,
+    parse_gitignore_func, permanent_exclusions, exclude_dirs, exclude_files, extensions)`
+    and `build_filtered_file_list` with the same arguments, but the directory tree
+    is listed and checked against the gitignore rules only once.
+
+    Returns:
+        A tuple (tree, file_list).
+    """
+    tree, file_list = _build_tree(
+        root,
+        True,
+        gitignore_file_abs_path,
+        parse_gitignore_func,
+        permanent_exclusions,
+        exclude_dirs,
+        exclude_files,
+        extensions,
+        config_pattern_yaml_local,
+    )
+    return tree, cast(List[str], file_list)
+
+
+def _build_tree(
+    root: str,
+    use_gitignore: bool,
+    gitignore_file_abs_path: Optional[str],
+    parse_gitignore_func: ParseGitignoreFuncType,
+    permanent_exclusions: AbstractSet[str],
+    user_exclude_dirs: List[str],
+    user_exclude_files: List[str],
+    extensions_for_content: List[str],
+    file_list_config_pattern: Optional[str],
+) -> Tuple[TreeDict, Optional[List[str]]]:
+    """
+    The walk behind `build_tree_structure` and `build_tree_and_file_list`.
+
+    When `file_list_config_pattern` is given, the `build_filtered_file_list`
+    result (leaving out names matching that pattern) is collected in the same
+    walk and returned alongside the tree; otherwise None is returned for it.
+    A directory whose tree node is excluded is then still walked for the file
+    list, as that function would, but adds nothing to the tree.
+    """
     tree: TreeDict = {}
     abs_root = os.path.abspath(root)  # Key: base for rule interpretation
+    # _walk_tree yields abs_root and normalized absolute paths below it, so the
+    # relative path of a directory is a slice off this prefix.
+    root_prefix = abs_root if abs_root.endswith(os.sep) else abs_root + os.sep
 
-    ignore_matcher: GitignoreMatcher = lambda _p: False
+    ignore_matcher: GitignoreMatcher = ignore_nothing
     if (
         use_gitignore and gitignore_file_abs_path
     ):  # Only load if path is given and we want to use it
@@ -150,108 +283,77 @@ def build_tree_structure(
             parse_gitignore_func,
             abs_root,  # Rules in the gitignore are interpreted relative to this scan root
         )
+    # No gitignore loaded (none given, or it is missing or unparsable): skip the matcher calls.
+    use_gitignore = ignore_matcher is not ignore_nothing
 
-    perm_exclude_set: Set[str] = permanent_exclusions
+    # Frozen once here: compile_name_matcher and count_contents key their caches
+    # on a frozenset, and freezing a frozenset again returns it unchanged.
+    perm_exclude_set: FrozenSet[str] = frozenset(permanent_exclusions)
+    is_perm_excluded_file = compile_name_matcher(perm_exclude_set)
     # ... (rest of the function remains the same as your "production ready" version) ...
-    user_exclude_dirs_set: Set[str] = set(user_exclude_dirs)
-    user_exclude_files_set: Set[str] = set(user_exclude_files)
-
-    exact_match_patterns_for_content: Set[str] = set()
-    suffix_match_patterns_for_content: Set[str] = set()
-
-    if extensions_for_content:
-        for ext_input in extensions_for_content:
-            ext_lower = ext_input.lower()
-            if ext_lower.startswith("."):
-                suffix_match_patterns_for_content.add(ext_lower)
-            elif "." not in ext_lower:
-                exact_match_patterns_for_content.add(ext_lower)
-                suffix_match_patterns_for_content.add("." + ext_lower)
-            else:
-                exact_match_patterns_for_content.add(ext_lower)
+    user_exclude_dirs_set: FrozenSet[str] = frozenset(user_exclude_dirs)
+    user_exclude_files_set: FrozenSet[str] = frozenset(user_exclude_files)
 
-    excluded_counts_cache: Dict[str, Tuple[int, int]] = {}
+    (
+        exact_match_patterns_for_content,
+        suffix_match_tuple_for_content,
+    ) = _split_extension_patterns(frozenset(extensions_for_content))
 
-    for dirpath, dirnames, filenames in os.walk(abs_root, topdown=True):
-        abs_dirpath = os.path.abspath(dirpath)
-        rel_dirpath = os.path.relpath(abs_dirpath, abs_root)
-
-        path_parts = abs_dirpath.split(os.sep)
-        # Ensure we don't descend into permanently excluded paths beyond the root itself
-        # Example: if abs_root is /a/b and perm_exclude has '.git', then /a/b/.git is fine for this check
-        # but /a/b/c/.git would make the `any` condition true if '.git' is in path_parts[2:]
-        is_in_perm_excluded_subpath = False
-        if abs_dirpath != abs_root:  # Only check subpaths, not the root itself
-            # Construct path parts relative to abs_root to check for permanent exclusions
-            # in the sub-path components.
-            # Example: abs_root = /foo, dirpath = /foo/bar/.git
-            # rel_dirpath_parts = ['bar', '.git'] -> check if 'bar' or '.git' are perm excluded
-            # This logic seems more complex than needed if perm_exclude are just names.
-            # The original simple check on d_name and filename_str later is usually sufficient
-            # if perm_exclude are names like '.git', not paths like 'some/sub/.git'
-            # For now, let's stick to the simpler check on d_name and filename_str later.
-            # The original check was:
-            # if any(part in perm_exclude_set for part in path_parts if os.path.join(*path_parts[:path_parts.index(part)+1]) != abs_root and part != '.'):
-            # This check is a bit convoluted. A simpler approach is to check `d_name` before adding to `dirnames[:]`.
-            pass
-
-        current_level_node: TreeDict = tree
-        if rel_dirpath != ".":
-            parts = rel_dirpath.split(os.sep)
-            path_is_valid = True
-            for part_idx, part in enumerate(parts):
-                child_node_any = current_level_node.get(part)
-
-                if not isinstance(child_node_any, dict):
-                    is_parent_excluded = False
-                    temp_node_check: TreeDict = tree
-                    for p_check in parts[: part_idx + 1]:
-                        node_val_any = temp_node_check.get(p_check)
-                        if isinstance(node_val_any, dict):
-                            node_val_as_treedict = cast(TreeDict, node_val_any)
-                            if node_val_as_treedict.get("_excluded_dir"):
-                                is_parent_excluded = True
-                                break
-                            temp_node_check = node_val_as_treedict
-                        else:  # Path component not a dict, implies structure error or excluded parent
-                            is_parent_excluded = True
-                            break
-
-                    if is_parent_excluded:
-                        dirnames[:] = []
-                        filenames[:] = []
-                        path_is_valid = False
-                        break
-
-                    new_child_node: TreeDict = {}
-                    current_level_node[part] = new_child_node
-                    current_level_node = new_child_node
-                else:
-                    current_level_node = cast(TreeDict, child_node_any)
-
-                if current_level_node.get("_excluded_dir"):
-                    dirnames[:] = []
-                    filenames[:] = []
-                    path_is_valid = False
-                    break
-            if not path_is_valid:
+    file_list: Optional[List[str]] = None
+    if file_list_config_pattern is not None:
+        file_list = []
+        match_config_pattern = compile_glob(file_list_config_pattern).match
+
+    excluded_counts_cache: Dict[str, Tuple[int, int]] = {}
+    # Where each directory queued by the walk sits in the tree, recorded by its parent
+    # as (parent node, or None below an excluded node; name in parent; guard nodes),
+    # so no directory re-walks the tree from its root. Guard nodes are the ancestors
+    # holding a child named "_excluded_dir": once that child is non-empty the path
+    # reads as excluded, just as walking down from the root would find.
+    pending_nodes: Dict[
+        str, Tuple[Optional[TreeDict], str, Tuple[TreeDict, ...]]
+    ] = {}
+
+    for abs_dirpath, dirnames, filenames in _walk_tree(abs_root):
+        at_root = abs_dirpath == abs_root
+        dir_prefix = root_prefix if at_root else abs_dirpath + os.sep
+        rel_dirpath = "." if at_root else abs_dirpath[len(root_prefix) :]
+
+        # None once this directory falls outside the tree (e.g. below an excluded node)
+        current_level_node: Optional[TreeDict] = tree
+        guard_nodes: Tuple[TreeDict, ...] = ()
+        if not at_root:
+            parent_node, name_in_parent, guard_nodes = pending_nodes.pop(abs_dirpath)
+            child_node_any = (
+                parent_node.get(name_in_parent) if parent_node is not None else None
+            )
+            if not isinstance(child_node_any, dict) or any(
+                guard_node.get("_excluded_dir") for guard_node in guard_nodes
+            ):
+                current_level_node = None
+            else:
+                current_level_node = cast(TreeDict, child_node_any)
+            if current_level_node is None and file_list is None:
+                dirnames[:] = []
                 continue
 
-        original_dirnames = list(
-            dirnames
-        )  # dirnames here are already filtered by os.walk's topdown=True if perm_exclude were in parent
+        # Excluded directories are pruned here, before the walk descends into
+        # them, so no path below one is ever visited or needs re-checking.
+        original_dirnames = list(dirnames)
         dirnames[:] = []  # Prepare to rebuild list of dirs to descend into
         for d_name in original_dirnames:
             if d_name in perm_exclude_set:  # Check for permanent exclusions by name
                 continue
 
-            abs_subdir_path = os.path.join(abs_dirpath, d_name)
+            abs_subdir_path = dir_prefix + d_name
             is_user_dir_excluded_explicitly = d_name in user_exclude_dirs_set
             is_dir_ignored_by_git: bool = use_gitignore and ignore_matcher(
                 abs_subdir_path
             )  # ignore_matcher is pre-configured
 
             if is_user_dir_excluded_explicitly or is_dir_ignored_by_git:
+                if current_level_node is None:
+                    continue
                 if abs_subdir_path not in excluded_counts_cache:
                     d_count, f_count = count_contents(abs_subdir_path, perm_exclude_set)
                     excluded_counts_cache[abs_subdir_path] = (d_count, f_count)
@@ -259,88 +361,94 @@ def build_tree_structure(
                     d_count, f_count = excluded_counts_cache[abs_subdir_path]
                 current_level_node[d_name] = {"_excluded_dir": True, "_dir_count": d_count, "_file_count": f_count, "_files": []}  # type: ignore
             else:
-                current_level_node.setdefault(d_name, {})  # Ensure dir entry exists
+                if current_level_node is not None:
+                    current_level_node.setdefault(d_name, {})  # Ensure dir entry exists
                 dirnames.append(d_name)  # Add to list of dirs to descend into
 
-        node_files_list_any = current_level_node.get("_files")
-        if node_files_list_any is None or not isinstance(node_files_list_any, list):
-            files_in_node: List[FileEntry] = []
-            current_level_node["_files"] = files_in_node  # type: ignore
-        else:
-            files_in_node = cast(List[FileEntry], node_files_list_any)
+        if (
+            current_level_node is not None
+            and not at_root
+            and "_excluded_dir" in current_level_node
+        ):
+            guard_nodes += (current_level_node,)
+        for d_name in dirnames:
+            pending_nodes[dir_prefix + d_name] = (current_level_node, d_name, guard_nodes)
+
+        files_in_node: Optional[List[FileEntry]] = None
+        if current_level_node is not None:
+            node_files_list_any = current_level_node.get("_files")
+            if node_files_list_any is None or not isinstance(node_files_list_any, list):
+                files_in_node = []
+                current_level_node["_files"] = files_in_node  # type: ignore
+            else:
+                files_in_node = cast(List[FileEntry], node_files_list_any)
+        if file_list is not None:
+            rel_dir_prefix = "" if at_root else rel_dirpath + os.sep
 
+        # Names within a directory are unique, so sorting the plain strings up front
+        # leaves the node's file entries in name order without a keyed sort of the dicts.
+        filenames.sort()
         for filename_str in filenames:
-            if filename_str in perm_exclude_set or any(
-                fnmatch.fnmatch(filename_str, pat)
-                for pat in perm_exclude_set
-                if "*" in pat or "?" in pat
-            ):
+            if is_perm_excluded_file(filename_str):
                 continue
 
-            full_path = os.path.join(abs_dirpath, filename_str)
             is_content_omitted_by_user_rule = filename_str in user_exclude_files_set
-            is_content_omitted_by_gitignore: bool = use_gitignore and ignore_matcher(
-                full_path
-            )
 
-            is_content_omitted_by_extension_rule: bool = False
-            if extensions_for_content:
-                fn_lower = filename_str.lower()
-                content_matched_by_extension = False
-                if fn_lower in exact_match_patterns_for_content:
-                    content_matched_by_extension = True
-                if not content_matched_by_extension and any(
-                    fn_lower.endswith(s_ext)
-                    for s_ext in suffix_match_patterns_for_content
-                ):
-                    content_matched_by_extension = True
-
-                if not content_matched_by_extension:
-                    is_content_omitted_by_extension_rule = True
+            fn_lower = filename_str if filename_str.islower() else filename_str.lower()
+            content_matched_by_extension = False
+            if fn_lower in exact_match_patterns_for_content:
+                content_matched_by_extension = True
+            if not content_matched_by_extension and fn_lower.endswith(
+                suffix_match_tuple_for_content
+            ):
+                content_matched_by_extension = True
+            is_content_omitted_by_extension_rule: bool = bool(
+                extensions_for_content
+            ) and not content_matched_by_extension
 
+            # The gitignore rules are the costliest test, so they are only consulted
+            # when no cheaper rule has already omitted the file.
             is_content_omitted: bool = (
                 is_content_omitted_by_user_rule
-                or is_content_omitted_by_gitignore
                 or is_content_omitted_by_extension_rule
+                or (use_gitignore and ignore_matcher(dir_prefix + filename_str))
             )
-            files_in_node.append({"name": filename_str, "omitted": is_content_omitted})
-
-        if files_in_node:
-            files_in_node.sort(key=lambda file_entry: file_entry["name"])
-        elif "_files" in current_level_node and not current_level_node.get(
-            "_files"
+            if files_in_node is not None:
+                files_in_node.append({"name": filename_str, "omitted": is_content_omitted})
+            if (
+                file_list is not None
+                and content_matched_by_extension
+                and not is_content_omitted
+                and not match_config_pattern(filename_str)
+            ):
+                file_list.append((rel_dir_prefix + filename_str).replace(os.sep, "/"))
+
+        if current_level_node is None:
+            continue
+        if (
+            not files_in_node
+            and "_files" in current_level_node
+            and not current_level_node.get("_files")
         ):  # No files added
             current_level_node.pop("_files", None)  # Remove empty list
-    return tree
+    if file_list is not None:
+        file_list.sort()
+    return tree, file_list
 
 
-# print_tree remains the same
-def print_tree(
-    tree: TreeDict,
-    root_display_name: Optional[str] = None,
-    indent: str = "",
-    is_last_entry_in_parent: bool = True,
-) -> List[str]:
-    """
-    Generates a list of strings representing the formatted directory tree.
+# A line of print_tree output, or a (node, indent) subtree still to be printed in its place.
+_TreeLineEntry = Union[str, Tuple[TreeDict, str]]
 
-    Args:
-        tree: The TreeDict structure (nested dictionaries) to print.
-        root_display_name: If provided, this name is printed as the root of the tree.
-                           If None, the function assumes it's printing a sub-tree.
-        indent: The string prefix for indentation of the current level.
-        is_last_entry_in_parent: Flag indicating if the current tree/node being printed
-                                 is the last child of its parent. Affects connectors.
 
-    Returns:
-        A list of strings, where each string is a line in the formatted tree.
+def _node_line_entries(tree: TreeDict, current_prefix: str) -> List[_TreeLineEntry]:
     """
-    lines: List[str] = []
-    current_prefix = indent
+    Formats the entries of one tree node for `print_tree`, directories first.
 
-    if root_display_name is not None:
-        lines.append(root_display_name)
-        current_prefix = ""
+    Each directory that is not excluded is followed by a `(node, indent)`
+    placeholder for its subtree, so nested levels are expanded by the
+    caller without recursion.
+    """
+    entries: List[_TreeLineEntry] = []
 
     dir_items: List[Tuple[str, TreeDict]] = []
     raw_files_any = tree.get(
@@ -392,21 +500,13 @@ def print_tree(
             file_count = (
                 int(file_count_val) if isinstance(file_count_val, (int, float)) else 0
             )
-            lines.append(
+            entries.append(
                 f"{current_prefix}{connector}{dir_name}/ [Content Omitted: Dirs: {dir_count}, Files: {file_count}]"
             )
         else:
-            lines.append(f"{current_prefix}{connector}{dir_name}/")
+            entries.append(f"{current_prefix}{connector}{dir_name}/")
             child_indent = current_prefix + ("    " if is_last else "│   ")
-            # Recursively print the subtree
-            lines.extend(
-                print_tree(
-                    dir_content_node,
-                    root_display_name=None,
-                    indent=child_indent,
-                    is_last_entry_in_parent=is_last,
-                )
-            )
+            entries.append((dir_content_node, child_indent))  # The subtree goes here
 
     for file_data in file_items_from_tree:
         entry_index += 1
@@ -417,5 +517,49 @@ def print_tree(
             "omitted", True
         )  # Default to omitted if flag is missing
         omitted_suffix = " [Content Omitted]" if omitted_flag else ""
-        lines.append(f"{current_prefix}{connector}{filename_str}{omitted_suffix}")
+        entries.append(f"{current_prefix}{connector}{filename_str}{omitted_suffix}")
+    return entries
+
+
+def print_tree(
+    tree: TreeDict,
+    root_display_name: Optional[str] = None,
+    indent: str = "",
+    is_last_entry_in_parent: bool = True,
+) -> List[str]:
+    """
+    Generates a list of strings representing the formatted directory tree.
+
+    The tree is traversed iteratively with a stack of per-node entry
+    iterators, so deep trees neither recurse nor build a list per level.
+
+    Args:
+        tree: The TreeDict structure (nested dictionaries) to print.
+        root_display_name: If provided, this name is printed as the root of the tree.
+                           If None, the function assumes it's printing a sub-tree.
+        indent: The string prefix for indentation of the current level.
+        is_last_entry_in_parent: Flag indicating if the current tree/node being printed
+                                 is the last child of its parent. Affects connectors.
+
+    Returns:
+        A list of strings, where each string is a line in the formatted tree.
+    """
+    lines: List[str] = []
+    current_prefix = indent
+
+    if root_display_name is not None:
+        lines.append(root_display_name)
+        current_prefix = ""
+
+    pending_entries: List[Iterator[_TreeLineEntry]] = [
+        iter(_node_line_entries(tree, current_prefix))
+    ]
+    while pending_entries:
+        entry = next(pending_entries[-1], None)
+        if entry is None:
+            pending_entries.pop()  # This level is done; resume its parent
+        elif isinstance(entry, str):
+            lines.append(entry)
+        else:
+            pending_entries.append(iter(_node_line_entries(*entry)))
     return lines
@@ -1,14 +1,271 @@
 # codexify/main.py
-from typing import List, Optional, Dict, Any, Callable, Set
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Callable, FrozenSet, TextIO, Tuple, TypeVar, cast
+import functools
+import hashlib
 import os
-import tiktoken
-from gitignore_parser import parse_gitignore
+import re
+import threading
 
 from .types import CompilationConfig, CompilationResult
 from .core.common import BASE_PERMANENT_EXCLUSIONS, CONFIG_FILE_PATTERN
-from .core.go_utils import get_go_package_locations, get_go_package_content_files
-from .core.tree_builder import build_tree_structure, print_tree, build_filtered_file_list, TreeDict
-from .core.content_compiler import assemble_compiled_content
+from .core.go_utils import get_go_package_locations, get_go_package_content_files, GoSourceFile
+from .core.tree_builder import build_tree_structure, build_tree_and_file_list, print_tree, TreeDict
+from .core.content_compiler import assemble_compiled_content, write_compiled_content
+from .core.file_system import clear_caches as _clear_file_system_caches
+
+# Buffer size for the output file, so streamed output reaches the disk in a
+# few large writes rather than one syscall per 8 KiB.
+_OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Tokens are counted in blocks of roughly this many characters, up to
+# _TOKEN_COUNT_THREADS blocks at a time when the encoding has encode_batch.
+_TOKEN_COUNT_BLOCK_SIZE = 1 << 20
+_TOKEN_COUNT_THREADS = min(8, os.cpu_count() or 1)
+
+# Number of block token counts remembered, so an unchanged block of a recompiled
+# output is not encoded again.
+_TOKEN_COUNT_CACHE_SIZE = 32
+
+# The empty set that the frozen permanent-exclusion sets are built from with union().
+_EMPTY_EXCLUSIONS: FrozenSet[str] = frozenset()
+
+# Go package trees are built on up to this many threads.
+_PACKAGE_TREE_WORKERS = 8
+
+# A newline followed by a non-whitespace character. No cl100k_base token spans
+# one, so in-memory text split there has the same token count as a whole.
+_TOKEN_BOUNDARY_REGEX = re.compile(r"\n(?=\S)")
+
+
+@functools.lru_cache(maxsize=1)
+def _default_tiktoken_module() -> Any:
+    """Imports `tiktoken` on first use; it is slow to import and only needed for token counting."""
+    import tiktoken
+    return tiktoken
+
+
+# Encodings already built, by (id of the tiktoken module, encoding name). The module
+# is stored alongside so a reused id is not mistaken for the module it once named.
+_ENCODING_CACHE: Dict[Tuple[int, str], Tuple[Any, Any]] = {}
+
+
+def _get_encoding(tiktoken_mod: Any, encoding_name: str) -> Any:
+    """
+    Returns `tiktoken_mod.get_encoding(encoding_name)`, built once per module and encoding name.
+
+    Keyed on the module's identity rather than the module itself, as a
+    `config.tiktoken_module` stand-in need not be hashable.
+    """
+    cache_key = (id(tiktoken_mod), encoding_name)
+    cached = _ENCODING_CACHE.get(cache_key)
+    if cached is not None and cached[0] is tiktoken_mod:
+        return cached[1]
+    encoding = tiktoken_mod.get_encoding(encoding_name)
+    _ENCODING_CACHE[cache_key] = (tiktoken_mod, encoding)
+    return encoding
+
+
+@functools.lru_cache(maxsize=1)
+def _default_parse_gitignore() -> Callable[[str, Optional[str]], Callable[[str], bool]]:
+    """Imports `gitignore_parser.parse_gitignore` on first use."""
+    from gitignore_parser import parse_gitignore
+    return parse_gitignore
+
+
+def _split_for_token_count(text: str) -> List[str]:
+    """Splits `text` into blocks of about `_TOKEN_COUNT_BLOCK_SIZE` characters at token boundaries."""
+    blocks: List[str] = []
+    start = 0
+    while len(text) - start > _TOKEN_COUNT_BLOCK_SIZE:
+        boundary = _TOKEN_BOUNDARY_REGEX.search(text, start + _TOKEN_COUNT_BLOCK_SIZE)
+        if boundary is None:
+            break
+        blocks.append(text[start:boundary.end()])
+        start = boundary.end()
+    blocks.append(text[start:])
+    return blocks
+
+
+# Token counts of blocks already encoded, least recently used first, by (encoding
+# name, BLAKE2b digest of the block). Shared with the _TokenCountingWriter threads.
+_TOKEN_COUNT_CACHE: "OrderedDict[Tuple[Optional[str], bytes], int]" = OrderedDict()
+_TOKEN_COUNT_CACHE_LOCK = threading.Lock()
+
+
+def _encode_counts(encoding: Any, blocks: List[str]) -> List[int]:
+    """Encodes `blocks`, concurrently if the encoding has `encode_batch`, and returns their token counts."""
+    if len(blocks) > 1 and hasattr(encoding, "encode_batch"):
+        try:
+            return list(map(len, encoding.encode_batch(blocks, allowed_special="all", num_threads=_TOKEN_COUNT_THREADS)))
+        except TypeError: # An older encode_batch without these keywords
+            pass
+    return [len(encoding.encode(block, allowed_special="all")) for block in blocks]
+
+
+def _count_text_tokens(encoding: Any, text: str) -> int:
+    """Returns the token count of `text`, counted in blocks split at token boundaries."""
+    return _count_tokens(encoding, _split_for_token_count(text))
+
+
+def _count_tokens(encoding: Any, blocks: List[str]) -> int:
+    """
+    Sums the token counts of `blocks`.
+
+    Blocks seen before in this process are looked up by digest rather than
+    encoded again. Hashing runs far faster than encoding, so an output
+    recompiled without changes costs almost nothing to count.
+    """
+    encoding_name: Optional[str] = getattr(encoding, "name", None)
+    keys = [
+        (encoding_name, hashlib.blake2b(block.encode("utf-8", "surrogatepass"), digest_size=16).digest())
+        for block in blocks
+    ]
+    with _TOKEN_COUNT_CACHE_LOCK:
+        counts: List[Optional[int]] = [_TOKEN_COUNT_CACHE.get(key) for key in keys]
+        for key, count in zip(keys, counts):
+            if count is not None:
+                _TOKEN_COUNT_CACHE.move_to_end(key)
+    missing = [i for i, count in enumerate(counts) if count is None]
+    if missing:
+        new_counts = _encode_counts(encoding, [blocks[i] for i in missing])
+        with _TOKEN_COUNT_CACHE_LOCK:
+            for i, count in zip(missing, new_counts):
+                counts[i] = count
+                _TOKEN_COUNT_CACHE[keys[i]] = count
+            while len(_TOKEN_COUNT_CACHE) > _TOKEN_COUNT_CACHE_SIZE:
+                _TOKEN_COUNT_CACHE.popitem(last=False)
+    return sum(cast(List[int], counts))
+
+
+class _TokenCountingWriter:
+    """
+    A write-through text stream that counts the tokens of everything written to it.
+
+    Used when the output is streamed to disk: written text is buffered, cut into
+    blocks at token boundaries and counted on a background thread while writing
+    goes on, so the output file never has to be read back. The count is that of
+    the whole text encoded at once.
+    """
+
+    def __init__(self, out: TextIO, encoding: Any) -> None:
+        self._out = out
+        self._encoding = encoding
+        self._pending: List[str] = []
+        self._pending_size = 0
+        # Text is handed to the counter once this much is pending; raised past a
+        # long run without any token boundary so it is not re-split on every write.
+        self._submit_at = _TOKEN_COUNT_BLOCK_SIZE * _TOKEN_COUNT_THREADS
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        self._block_counts: List["Future[int]"] = []
+
+    def write(self, text: str) -> int:
+        written = self._out.write(text)
+        self._pending.append(text)
+        self._pending_size += len(text)
+        if self._pending_size >= self._submit_at:
+            blocks = _split_for_token_count("".join(self._pending))
+            tail = blocks.pop()  # May continue in the next write, so it is kept back
+            self._pending = [tail]
+            self._pending_size = len(tail)
+            self._submit_at = self._pending_size + _TOKEN_COUNT_BLOCK_SIZE * _TOKEN_COUNT_THREADS
+            if blocks:
+                self._block_counts.append(self._pool.submit(_count_tokens, self._encoding, blocks))
+        return written
+
+    def token_count(self) -> int:
+        """Counts the text still pending and returns the total for everything written, then closes the counter."""
+        try:
+            blocks = _split_for_token_count("".join(self._pending))
+            self._pending = []
+            self._block_counts.append(self._pool.submit(_count_tokens, self._encoding, blocks))
+            return sum(block_count.result() for block_count in self._block_counts)
+        finally:
+            self._pool.shutdown()
+
+    def close(self) -> None:
+        """Stops the counter without waiting for a total, e.g. after a failed write."""
+        self._pool.shutdown(wait=False)
+
+
+def _build_package_tree(
+    package_item: Tuple[str, str],
+    parse_gitignore_func: Callable[[str, Optional[str]], Callable[[str], bool]],
+    go_perm_excludes: FrozenSet[str],
+) -> Tuple[TreeDict, List[str]]:
+    """Builds the tree and tree lines of one `(import path, directory)` Go package."""
+    pkg_path, pkg_dir = package_item
+    pkg_tree: TreeDict = build_tree_structure(
+        pkg_dir, False, None, parse_gitignore_func,
+        go_perm_excludes, [], [], ['.go']
+    )
+    return pkg_tree, print_tree(pkg_tree, root_display_name=f"package:{pkg_path}")
+
+
+_OpenedFile = TypeVar("_OpenedFile")
+
+
+def _open_output(file_path: str, open_file: Callable[[str], _OpenedFile]) -> _OpenedFile:
+    """
+    Returns `open_file(file_path)`, creating the missing parent directories of `file_path` if needed.
+
+    The parent directories are only created, and the open retried, once the
+    first attempt fails because they are missing, so writing to an existing
+    output directory costs no extra syscalls.
+    """
+    try:
+        return open_file(file_path)
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        return open_file(file_path)
+
+
+def _write_text_file(file_path: str, text: str) -> None:
+    """
+    Writes `text` to `file_path` as UTF-8, as `open(file_path, "w", encoding="utf-8")` would.
+
+    The text is encoded once and handed to the raw file descriptor in as few
+    `os.write` calls as the OS allows, skipping the text layer's chunked
+    encoding and buffer copies. Newlines are translated to `os.linesep` the
+    way text mode does. Missing parent directories are created.
+    """
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    data = memoryview(text.encode("utf-8"))
+    fd = _open_output(
+        file_path,
+        lambda path: os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666),
+    )
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def _output_write_failure(config: CompilationConfig, error: Exception) -> CompilationResult:
+    """Builds the failed `CompilationResult` for an error raised while writing the output file."""
+    if isinstance(error, IOError):
+        message = f"Failed to write output file '{config.output_file_path}': {error}"
+    else: # Other potential errors during file write
+        message = f"An unexpected error occurred writing output file '{config.output_file_path}': {error}"
+    return CompilationResult(success=False, error_message=message)
+
+
+def clear_caches() -> None:
+    """
+    Drops the caches Codexify keeps between compilations in this process.
+
+    Built tiktoken encodings, block token counts, parsed gitignore files and
+    binary-file verdicts are all kept so repeated compilations skip work they
+    already did. `generate_compiled_output` never clears them; long-lived
+    callers that want the memory back call this themselves.
+    """
+    _ENCODING_CACHE.clear()
+    with _TOKEN_COUNT_CACHE_LOCK:
+        _TOKEN_COUNT_CACHE.clear()
+    _clear_file_system_caches()
 
 
 def generate_compiled_output(config: CompilationConfig) -> CompilationResult:
@@ -16,12 +273,13 @@ def generate_compiled_output(config: CompilationConfig) -> CompilationResult:
     Generates compiled output based on the provided configuration.
 
     This function orchestrates the entire compilation process:
-    1. Initializes necessary modules (tiktoken, gitignore parser).
-       If they are missing, an ImportError will be raised.
+    1. Initializes the gitignore parser, importing it on first use unless one is
+       given in the config. If it is missing, an ImportError will be raised.
     2. Sets up permanent exclusions for path and Go package processing.
     3. If a project path is provided:
         - Builds a directory tree structure, respecting .gitignore and other exclusions.
-        - Filters files based on specified extensions and exclusion rules.
+        - Filters files based on specified extensions and exclusion rules, in the
+          same walk over the directory tree.
         - Collects lines for the tree representation.
     4. If Go packages are specified:
         - Locates Go packages on disk using the `go` command-line tool.
@@ -30,9 +288,13 @@ def generate_compiled_output(config: CompilationConfig) -> CompilationResult:
     5. Assembles the final compiled text, including all gathered tree representations
        and the content of the selected files from both the project path and Go packages.
     6. Calculates an estimated token count of the compiled text using the tiktoken
-       library with the "cl100k_base" encoding.
+       library with the "cl100k_base" encoding. tiktoken is imported on first
+       use; if it is missing, the token count is left at 0. Output streamed to
+       disk is counted while it is written. Skipped entirely when
+       `config.compute_token_count` is False.
     7. If an output file path is specified in the configuration, writes the compiled
-       text to that file, creating parent directories if they do not exist.
+       text to that file, creating parent directories if they do not exist. The
+       file is written while the token count is being computed.
 
     Args:
         config: A `CompilationConfig` object containing all parameters
@@ -43,18 +305,20 @@ def generate_compiled_output(config: CompilationConfig) -> CompilationResult:
     if config.verbose:
         print("--- Starting Compilation Process (Programmatic Call) ---")
 
-    # If tiktoken_module is not pre-set in config, use the direct import.
-    # An ImportError will occur here if tiktoken is not installed.
-    effective_tiktoken_mod: Any = config.tiktoken_module or tiktoken
-
-    # If parse_gitignore_func is not pre-set in config, use the direct import.
+    # If parse_gitignore_func is not pre-set in config, import it (once per process).
     # An ImportError will occur if gitignore_parser is not installed.
     effective_parse_git_func: Callable[[str, Optional[str]], Callable[[str], bool]] = \
-        config.parse_gitignore_func or parse_gitignore
+        config.parse_gitignore_func or _default_parse_gitignore()
 
-    path_perm_excludes: Set[str] = BASE_PERMANENT_EXCLUSIONS.union(config.additional_path_permanent_exclusions)
-    path_perm_excludes.add(CONFIG_FILE_PATTERN)
-    go_perm_excludes: Set[str] = BASE_PERMANENT_EXCLUSIONS.union(config.additional_go_permanent_exclusions)
+    # Frozen once: the tree builders and count_contents key their compiled matchers on
+    # these sets, and passing them on frozen spares each of them a copy. Built straight
+    # into a frozenset, with no intermediate set to copy.
+    path_perm_excludes: FrozenSet[str] = _EMPTY_EXCLUSIONS.union(
+        BASE_PERMANENT_EXCLUSIONS, config.additional_path_permanent_exclusions, (CONFIG_FILE_PATTERN,)
+    )
+    go_perm_excludes: FrozenSet[str] = _EMPTY_EXCLUSIONS.union(
+        BASE_PERMANENT_EXCLUSIONS, config.additional_go_permanent_exclusions
+    )
 
     path_tree_lines: List[str] = []
     filtered_path_files: List[str] = []
@@ -66,13 +330,11 @@ def generate_compiled_output(config: CompilationConfig) -> CompilationResult:
             return CompilationResult(success=False, error_message=f"Project path '{config.project_path}' is not a valid directory.")
         if config.verbose:
             print(f"\n--- Processing Directory: {root_abs_path} ---")
-            print(f"Permanently excluding from path processing: {', '.join(sorted(list(path_perm_excludes)))}")
+            print(f"Permanently excluding from path processing: {', '.join(sorted(path_perm_excludes))}")
 
-        path_tree: TreeDict = build_tree_structure(
-            root_abs_path, True, config.gitignore_file_path, effective_parse_git_func,
-            path_perm_excludes, config.exclude_dirs, config.exclude_files, config.extensions
-        )
-        filtered_path_files = build_filtered_file_list(
+        path_tree: TreeDict
+        # One walk yields both the displayed tree and the files whose content is compiled.
+        path_tree, filtered_path_files = build_tree_and_file_list(
             root_abs_path, config.extensions, config.exclude_dirs, config.exclude_files,
             config.gitignore_file_path, effective_parse_git_func, path_perm_excludes, CONFIG_FILE_PATTERN
         )
@@ -82,65 +344,120 @@ def generate_compiled_output(config: CompilationConfig) -> CompilationResult:
          print("\n--- No project_path specified, skipping local directory processing. ---")
 
     package_tree_lines_map: Dict[str, List[str]] = {}
-    package_content_files: List[Dict[str, str]] = []
+    package_content_files: List[GoSourceFile] = []
     package_trees_map: Dict[str, TreeDict] = {}
 
     if config.go_packages:
         if config.verbose:
             print(f"\n--- Processing Go Packages: {config.go_packages} ---")
-            print(f"Permanently excluding from Go package processing: {', '.join(sorted(list(go_perm_excludes)))}")
+            print(f"Permanently excluding from Go package processing: {', '.join(sorted(go_perm_excludes))}")
 
-        project_root_for_go_mod = root_abs_path if root_abs_path and os.path.exists(os.path.join(root_abs_path, 'go.mod')) else os.getcwd()
-        package_locations = get_go_package_locations(config, config.go_packages, project_root_for_go_mod)
+        # get_go_package_locations runs `go list` from root_abs_path if it holds a go.mod, else from the cwd.
+        package_locations = get_go_package_locations(config, config.go_packages, root_abs_path)
 
         if package_locations:
-            for pkg_path, pkg_dir in package_locations.items():
+            package_items = list(package_locations.items())
+            for pkg_path, pkg_dir in package_items:
                 if config.verbose: print(f"Building tree for package: {pkg_path} (from {pkg_dir})")
-                pkg_tree: TreeDict = build_tree_structure(
-                    pkg_dir, False, None, effective_parse_git_func,
-                    go_perm_excludes, [], [], ['.go']
-                )
+            build_package_tree = functools.partial(
+                _build_package_tree, parse_gitignore_func=effective_parse_git_func, go_perm_excludes=go_perm_excludes
+            )
+            if len(package_items) < 2:
+                package_trees = [build_package_tree(item) for item in package_items]
+            else:
+                # Each package is an independent directory walk; listing releases the GIL.
+                with ThreadPoolExecutor(max_workers=min(_PACKAGE_TREE_WORKERS, len(package_items))) as pool:
+                    package_trees = list(pool.map(build_package_tree, package_items))
+            for (pkg_path, _pkg_dir), (pkg_tree, pkg_tree_lines) in zip(package_items, package_trees):
                 package_trees_map[pkg_path] = pkg_tree
-                package_tree_lines_map[pkg_path] = print_tree(pkg_tree, root_display_name=f"package:{pkg_path}")
+                package_tree_lines_map[pkg_path] = pkg_tree_lines
             package_content_files = get_go_package_content_files(config, package_locations)
         elif config.verbose:
             print("No Go package locations found or 'go' command failed, cannot process packages.")
     elif config.verbose:
         print("\n--- No go_packages specified, skipping Go package processing. ---")
 
-    compiled_text, files_compiled, files_skipped = assemble_compiled_content(
-        config, root_abs_path, path_tree_lines, filtered_path_files,
-        package_tree_lines_map, package_content_files, package_trees_map,
-        path_perm_excludes, go_perm_excludes
-    )
+    abs_output_path: Optional[str] = os.path.abspath(config.output_file_path) if config.output_file_path else None
+    output_file_written_path = None
+    compiled_text: Optional[str] = None
+    write_error: Optional[Exception] = None
 
+    # If tiktoken_module is not pre-set in config, tiktoken is imported here (once per process).
+    # It is loaded before the output is produced so streamed output can be counted as it is
+    # written; any failure is reported once the output exists, the compilation goes on.
+    # `encoding` stays None when no token count is to be computed.
     token_count_val = 0
-    # effective_tiktoken_mod refers to the imported tiktoken module or one passed via config
-    if effective_tiktoken_mod:
+    token_error: Optional[Exception] = None
+    encoding: Any = None
+    if config.compute_token_count:
         try:
-            encoding = effective_tiktoken_mod.get_encoding("cl100k_base")
-            token_count_val = len(encoding.encode(compiled_text, allowed_special="all"))
-        except Exception as e_token:
-            if config.verbose: print(f"\nWarning: Could not calculate token count using tiktoken: {e_token}")
-            # An ImportError specifically for tiktoken here would mean it was not installed
-            # and config.tiktoken_module was also None.
-            if isinstance(e_token, ImportError) and "tiktoken" in str(e_token).lower():
-                 print("Please ensure 'tiktoken' is installed: pip install tiktoken")
-
+            effective_tiktoken_mod: Any = config.tiktoken_module or _default_tiktoken_module()
+            encoding = _get_encoding(effective_tiktoken_mod, "cl100k_base")
+        except Exception as e_encoding:
+            token_error = e_encoding
 
-    output_file_written_path = None
-    if config.output_file_path:
+    if abs_output_path and not config.keep_compiled_text:
+        # Stream straight into the output file; the full text is never held in memory.
+        token_counter: Optional[_TokenCountingWriter] = None
         try:
-            abs_output_path = os.path.abspath(config.output_file_path)
-            os.makedirs(os.path.dirname(abs_output_path), exist_ok=True)
-            with open(abs_output_path, "w", encoding="utf-8") as outfile:
-                outfile.write(compiled_text)
+            with _open_output(
+                abs_output_path, lambda path: open(path, "w", encoding="utf-8", buffering=_OUTPUT_BUFFER_SIZE)
+            ) as outfile:
+                content_out: TextIO = outfile
+                if encoding is not None:
+                    token_counter = _TokenCountingWriter(outfile, encoding)
+                    content_out = cast(TextIO, token_counter)
+                files_compiled, files_skipped = write_compiled_content(
+                    config, root_abs_path, path_tree_lines, filtered_path_files,
+                    package_tree_lines_map, package_content_files, package_trees_map,
+                    path_perm_excludes, go_perm_excludes, content_out
+                )
             output_file_written_path = abs_output_path
             if config.verbose: print(f"Output successfully written to: {abs_output_path}")
-        except IOError as e_io:
-            return CompilationResult(success=False, error_message=f"Failed to write output file '{config.output_file_path}': {e_io}")
-        except Exception as e_general_write: # Catch other potential errors during file write
-            return CompilationResult(success=False, error_message=f"An unexpected error occurred writing output file '{config.output_file_path}': {e_general_write}")
+        except Exception as e_write:
+            if token_counter is not None:
+                token_counter.close()
+            return _output_write_failure(config, e_write)
+        if token_counter is not None:
+            try:
+                token_count_val = token_counter.token_count()
+            except Exception as e_token:
+                token_error = e_token
+    else:
+        compiled_text, files_compiled, files_skipped = assemble_compiled_content(
+            config, root_abs_path, path_tree_lines, filtered_path_files,
+            package_tree_lines_map, package_content_files, package_trees_map,
+            path_perm_excludes, go_perm_excludes
+        )
+        # Tokens are counted on a second thread while the file is written; encoding releases the GIL.
+        with ThreadPoolExecutor(max_workers=1) as token_pool:
+            token_future: Optional["Future[int]"] = None
+            if encoding is not None:
+                token_future = token_pool.submit(_count_text_tokens, encoding, compiled_text)
+            if abs_output_path:
+                try:
+                    _write_text_file(abs_output_path, compiled_text)
+                    output_file_written_path = abs_output_path
+                except Exception as e_write:
+                    write_error = e_write
+            if token_future is not None:
+                try:
+                    token_count_val = token_future.result()
+                except Exception as e_token:
+                    token_error = e_token
+
+    if token_error is not None:
+        if config.verbose: print(f"\nWarning: Could not calculate token count using tiktoken: {token_error}")
+        # An ImportError specifically for tiktoken here would mean it was not installed
+        # and config.tiktoken_module was also None.
+        if isinstance(token_error, ImportError) and "tiktoken" in str(token_error).lower():
+             print("Please ensure 'tiktoken' is installed: pip install tiktoken")
+
+
+    if write_error is not None:
+        return _output_write_failure(config, write_error)
+    if compiled_text is not None and output_file_written_path and config.verbose:
+        print(f"Output successfully written to: {output_file_written_path}")
 
 
     return CompilationResult(
@@ -34,6 +34,14 @@ class CompilationConfig:
                               `gitignore_parser`). If None, the system will attempt to import
                               or install the necessary library.
         verbose: Boolean flag indicating whether to print detailed progress messages during compilation.
+        keep_compiled_text: If True (the default), the compiled text is built in memory and returned
+                            in `CompilationResult.compiled_text`. If False and `output_file_path` is set,
+                            the output is streamed straight to that file instead, keeping memory use
+                            bounded for large projects; `compiled_text` is then None.
+        compute_token_count: If True (the default), the token count of the output is estimated with
+                             tiktoken and returned in `CompilationResult.token_count`. Set it to False
+                             when the count is not needed: tokenizing is the costliest step on large
+                             outputs, and tiktoken is then never imported. `token_count` is then 0.
     """
     project_path: Optional[str] = None
     extensions: List[str] = field(default_factory=list)
@@ -47,6 +55,8 @@ class CompilationConfig:
     tiktoken_module: Optional[Any] = None
     parse_gitignore_func: Optional[Callable[[str, Optional[str]], Callable[[str], bool]]] = None
     verbose: bool = True
+    keep_compiled_text: bool = True
+    compute_token_count: bool = True
 
 @dataclass
 class CompilationResult:
@@ -0,0 +1,42 @@
+import os
+
+from codexify.cli import _classify_output
+
+
+def test_existing_directory_is_used_as_is(tmp_path):
+    assert _classify_output(str(tmp_path)) == (str(tmp_path), None)
+
+
+def test_trailing_separator_names_a_new_directory(tmp_path):
+    new_dir = os.path.join(str(tmp_path), "missing")
+    assert _classify_output(new_dir + os.sep) == (new_dir, None)
+
+
+def test_txt_suffix_is_stripped(tmp_path):
+    target = os.path.join(str(tmp_path), "report.txt")
+    assert _classify_output(target) == (str(tmp_path), "report")
+
+
+def test_txt_suffix_is_matched_case_insensitively(tmp_path):
+    target = os.path.join(str(tmp_path), "report.TXT")
+    assert _classify_output(target) == (str(tmp_path), "report")
+
+
+def test_other_suffix_is_kept(tmp_path):
+    target = os.path.join(str(tmp_path), "report.md")
+    assert _classify_output(target) == (str(tmp_path), "report.md")
+
+
+def test_name_without_suffix(tmp_path):
+    target = os.path.join(str(tmp_path), "report")
+    assert _classify_output(target) == (str(tmp_path), "report")
+
+
+def test_bare_name_has_no_directory():
+    assert _classify_output("report.txt") == ("", "report")
+
+
+def test_existing_file_is_taken_as_a_file_name(tmp_path):
+    existing = tmp_path / "compiled.txt"
+    existing.write_text("old output")
+    assert _classify_output(str(existing)) == (str(tmp_path), "compiled")
@@ -0,0 +1,88 @@
+import os
+import sys
+
+import pytest
+
+from codexify import CompilationConfig
+from codexify.core.go_utils import get_go_package_locations
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="uses a POSIX script as the fake 'go' command")
+
+# A stand-in for the 'go' command. `go list -f {{.Dir}} PKG...` maps each package
+# to a directory under $FAKE_GO_ROOT and, like go list without -e, prints nothing
+# and fails when any of them does not exist. Every call is logged.
+_FAKE_GO = """#!{python}
+import os, sys
+root = os.environ["FAKE_GO_ROOT"]
+with open(os.path.join(root, "calls.log"), "a") as log:
+    log.write(" ".join(sys.argv[1:]) + "\\n")
+if sys.argv[1] == "version":
+    print("go version go1.22.0 fake/amd64")
+    sys.exit(0)
+dirs = [os.path.join(root, pkg.replace("/", "_")) for pkg in sys.argv[4:]]
+missing = [pkg for pkg, d in zip(sys.argv[4:], dirs) if not os.path.isdir(d)]
+if missing:
+    sys.stderr.write("cannot find package " + missing[0] + "\\n")
+    sys.exit(1)
+print("\\n".join(dirs))
+"""
+
+
+@pytest.fixture
+def go_root(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    go = bin_dir / "go"
+    go.write_text(_FAKE_GO.format(python=sys.executable))
+    go.chmod(0o755)
+    for pkg in ("example.com_a", "example.com_b"):
+        (tmp_path / pkg).mkdir()
+    monkeypatch.setenv("PATH", str(bin_dir))
+    monkeypatch.setenv("FAKE_GO_ROOT", str(tmp_path))
+    return tmp_path
+
+
+def _list_calls(go_root):
+    calls = (go_root / "calls.log").read_text().splitlines()
+    return [call for call in calls if call.startswith("list ")]
+
+
+def _locate(go_root, packages):
+    return get_go_package_locations(CompilationConfig(verbose=False), packages, str(go_root))
+
+
+def test_packages_are_resolved_with_one_go_list_call(go_root):
+    locations = _locate(go_root, ["example.com/a", "example.com/b"])
+
+    assert locations == {
+        "example.com/a": str(go_root / "example.com_a"),
+        "example.com/b": str(go_root / "example.com_b"),
+    }
+    assert _list_calls(go_root) == ["list -f {{.Dir}} example.com/a example.com/b"]
+
+
+def test_failing_batch_falls_back_to_one_call_per_package(go_root, capsys):
+    locations = _locate(go_root, ["example.com/a", "example.com/missing", "example.com/b"])
+
+    assert locations == {
+        "example.com/a": str(go_root / "example.com_a"),
+        "example.com/b": str(go_root / "example.com_b"),
+    }
+    assert _list_calls(go_root) == [
+        "list -f {{.Dir}} example.com/a example.com/missing example.com/b",
+        "list -f {{.Dir}} example.com/a",
+        "list -f {{.Dir}} example.com/missing",
+        "list -f {{.Dir}} example.com/b",
+    ]
+    assert "failed for package 'example.com/missing'" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "packages",
+    [["example.com/a/...", "example.com/b"], ["example.com/a", "example.com/a"], ["example.com/a"]],
+    ids=["wildcard", "duplicate", "single"],
+)
+def test_unbatchable_paths_are_located_one_by_one(go_root, packages):
+    _locate(go_root, packages)
+
+    assert _list_calls(go_root) == [f"list -f {{{{.Dir}}}} {pkg}" for pkg in packages]
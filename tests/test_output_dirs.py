@@ -0,0 +1,88 @@
+import types
+
+import pytest
+
+from codexify import CompilationConfig, generate_compiled_output
+from codexify import main as codexify_main
+
+
+def _fail_makedirs(*args, **kwargs):
+    raise AssertionError("os.makedirs should not be called")
+
+
+def test_existing_directory_is_opened_without_makedirs(tmp_path, monkeypatch):
+    monkeypatch.setattr(codexify_main.os, "makedirs", _fail_makedirs)
+    target = str(tmp_path / "out.txt")
+
+    with codexify_main._open_output(target, lambda path: open(path, "w")) as f:
+        f.write("ok")
+
+    assert (tmp_path / "out.txt").read_text() == "ok"
+
+
+def test_missing_parents_are_created_and_the_open_retried_once(tmp_path):
+    target = tmp_path / "a" / "b" / "out.txt"
+    attempts = []
+
+    def open_file(path):
+        attempts.append(path)
+        return open(path, "w")
+
+    with codexify_main._open_output(str(target), open_file) as f:
+        f.write("ok")
+
+    assert attempts == [str(target), str(target)]
+    assert target.read_text() == "ok"
+
+
+def test_other_open_errors_are_not_retried(tmp_path):
+    attempts = []
+
+    def open_file(path):
+        attempts.append(path)
+        raise PermissionError(path)
+
+    with pytest.raises(PermissionError):
+        codexify_main._open_output(str(tmp_path / "out.txt"), open_file)
+    assert len(attempts) == 1
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "project"
+    root.mkdir()
+    (root / "main.py").write_text("print('hi')\n")
+    return root
+
+
+def _config(project, output_path, keep_compiled_text):
+    return CompilationConfig(
+        project_path=str(project),
+        extensions=[".py"],
+        output_file_path=str(output_path),
+        keep_compiled_text=keep_compiled_text,
+        compute_token_count=False,
+        tiktoken_module=types.SimpleNamespace(),
+        parse_gitignore_func=lambda gitignore_path, base_dir: (lambda path: False),
+        verbose=False,
+    )
+
+
+@pytest.mark.parametrize("keep_compiled_text", [True, False], ids=["in-memory", "streamed"])
+def test_output_into_missing_directories(project, tmp_path, keep_compiled_text):
+    output_path = tmp_path / "new" / "nested" / "out.txt"
+
+    result = generate_compiled_output(_config(project, output_path, keep_compiled_text))
+
+    assert result.success
+    assert "print('hi')" in output_path.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("keep_compiled_text", [True, False], ids=["in-memory", "streamed"])
+def test_parent_that_is_a_file_is_a_write_error(project, tmp_path, keep_compiled_text):
+    (tmp_path / "blocker").write_text("not a directory")
+
+    result = generate_compiled_output(_config(project, tmp_path / "blocker" / "out.txt", keep_compiled_text))
+
+    assert not result.success
+    assert "output file" in result.error_message
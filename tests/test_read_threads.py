@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+
+from codexify.core import content_compiler
+from codexify.core.content_compiler import READ_THREADS_ENV_VAR
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_importing_ignores_the_environment_variable():
+    env = dict(os.environ, **{READ_THREADS_ENV_VAR: "not-a-number"})
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (PACKAGE_ROOT, env.get("PYTHONPATH"))))
+    completed = subprocess.run(
+        [sys.executable, "-c", "import codexify"],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    assert completed.stdout == ""
+
+
+def test_variable_set_after_import_is_used(monkeypatch):
+    monkeypatch.setenv(READ_THREADS_ENV_VAR, "3")
+    assert content_compiler._read_worker_count() == 3
+    monkeypatch.setenv(READ_THREADS_ENV_VAR, "0")
+    assert content_compiler._read_worker_count() == 1
+
+
+def test_invalid_value_warns_and_falls_back(monkeypatch, capsys):
+    monkeypatch.delenv(READ_THREADS_ENV_VAR, raising=False)
+    default = content_compiler._read_worker_count()
+    monkeypatch.setenv(READ_THREADS_ENV_VAR, "many")
+
+    assert content_compiler._read_worker_count() == default
+    assert f"Ignoring invalid {READ_THREADS_ENV_VAR} value 'many'" in capsys.readouterr().out
+
+
+def test_read_ahead_keeps_file_order(tmp_path, monkeypatch):
+    paths = []
+    for i in range(20):
+        path = tmp_path / f"f{i}.py"
+        path.write_text(f"value = {i}\n")
+        paths.append(str(path))
+
+    monkeypatch.setenv(READ_THREADS_ENV_VAR, "1")
+    serial = list(content_compiler._read_ahead(paths, True))
+    monkeypatch.setenv(READ_THREADS_ENV_VAR, "3")
+    pooled = list(content_compiler._read_ahead(paths, True))
+
+    assert pooled == serial
+    assert [content for _, content, _ in pooled] == [f"value = {i}\n" for i in range(20)]
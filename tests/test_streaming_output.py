@@ -0,0 +1,95 @@
+import types
+
+import pytest
+
+from codexify import CompilationConfig, generate_compiled_output
+from codexify import main as codexify_main
+
+
+class _WhitespaceEncoding:
+    """Stand-in for a tiktoken encoding: one token per whitespace-separated word."""
+
+    def encode(self, text, allowed_special=None):
+        return text.split()
+
+
+def _fake_tiktoken():
+    encoding = _WhitespaceEncoding()
+    return types.SimpleNamespace(get_encoding=lambda name: encoding)
+
+
+def _ignore_nothing_parser(gitignore_path, base_dir):
+    return lambda path: False
+
+
+@pytest.fixture
+def project(tmp_path):
+    root = tmp_path / "project"
+    (root / "pkg" / "sub").mkdir(parents=True)
+    (root / "pkg" / "__init__.py").write_text("")
+    (root / "pkg" / "mod.py").write_text("def f():\n    return 'héllo'\n" * 50)
+    (root / "pkg" / "sub" / "deep.py").write_text("x = 1\r\ny = 2\r\n")
+    (root / "README.md").write_text("# Title\n\nSome words here.\n")
+    (root / "data.bin").write_bytes(b"\x00\x01\x02")
+    (root / "notes.txt").write_text("not compiled\n")
+    return root
+
+
+def _config(project, tmp_path, **overrides):
+    settings = dict(
+        project_path=str(project),
+        extensions=[".py", ".md"],
+        tiktoken_module=_fake_tiktoken(),
+        parse_gitignore_func=_ignore_nothing_parser,
+        verbose=False,
+    )
+    settings.update(overrides)
+    return CompilationConfig(**settings)
+
+
+def test_streamed_output_matches_in_memory_output(project, tmp_path):
+    in_memory = generate_compiled_output(
+        _config(project, tmp_path, output_file_path=str(tmp_path / "memory.txt"))
+    )
+    streamed = generate_compiled_output(
+        _config(project, tmp_path, output_file_path=str(tmp_path / "stream.txt"), keep_compiled_text=False)
+    )
+
+    assert in_memory.success and streamed.success
+    assert streamed.compiled_text is None
+    memory_bytes = (tmp_path / "memory.txt").read_bytes()
+    assert (tmp_path / "stream.txt").read_bytes() == memory_bytes
+    assert memory_bytes.decode("utf-8") == in_memory.compiled_text
+    assert streamed.token_count == in_memory.token_count > 0
+    assert (streamed.files_compiled_count, streamed.files_skipped_count) == (
+        in_memory.files_compiled_count,
+        in_memory.files_skipped_count,
+    )
+
+
+def test_token_count_skipped_when_not_requested(project, tmp_path):
+    counted = generate_compiled_output(_config(project, tmp_path))
+    uncounted = generate_compiled_output(_config(project, tmp_path, compute_token_count=False))
+
+    assert uncounted.success
+    assert uncounted.token_count == 0
+    assert uncounted.compiled_text == counted.compiled_text
+
+
+def test_token_counting_writer_matches_whole_text_count(monkeypatch):
+    # Small blocks, so the writer splits and submits text many times over.
+    monkeypatch.setattr(codexify_main, "_TOKEN_COUNT_BLOCK_SIZE", 64)
+    encoding = _WhitespaceEncoding()
+    pieces = [f"line {i} with some words\n" for i in range(500)] + ["tail without newline"]
+
+    written = []
+    out = types.SimpleNamespace(write=lambda text: written.append(text) or len(text))
+    writer = codexify_main._TokenCountingWriter(out, encoding)
+    for piece in pieces:
+        writer.write(piece)
+    count = writer.token_count()
+
+    text = "".join(pieces)
+    assert "".join(written) == text
+    assert count == len(encoding.encode(text))
+    assert count == codexify_main._count_text_tokens(encoding, text)
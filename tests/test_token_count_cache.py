@@ -0,0 +1,70 @@
+import types
+
+import pytest
+
+from codexify import CompilationConfig, clear_caches, generate_compiled_output
+from codexify import main as codexify_main
+
+
+class _CountingEncoding:
+    """Stand-in for a tiktoken encoding that records the text it is asked to encode."""
+
+    name = "counting_test_encoding"
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, text, allowed_special=None):
+        self.encoded.append(text)
+        return text.split()
+
+
+@pytest.fixture
+def encoding():
+    clear_caches()
+    yield _CountingEncoding()
+    clear_caches()
+
+
+@pytest.fixture
+def config(tmp_path, encoding):
+    (tmp_path / "a.py").write_text("print('hello world')\n")
+    return CompilationConfig(
+        project_path=str(tmp_path),
+        extensions=[".py"],
+        tiktoken_module=types.SimpleNamespace(get_encoding=lambda name: encoding),
+        parse_gitignore_func=lambda gitignore_path, base_dir: (lambda path: False),
+        verbose=False,
+    )
+
+
+def test_unchanged_output_is_not_encoded_again(config, encoding):
+    first = generate_compiled_output(config)
+    encoded_once = len(encoding.encoded)
+    second = generate_compiled_output(config)
+
+    assert encoded_once > 0
+    assert len(encoding.encoded) == encoded_once
+    assert second.token_count == first.token_count
+
+
+def test_clear_caches_forces_a_recount(config, encoding):
+    first = generate_compiled_output(config)
+    encoded_once = len(encoding.encoded)
+    clear_caches()
+    second = generate_compiled_output(config)
+
+    assert len(encoding.encoded) == 2 * encoded_once
+    assert second.token_count == first.token_count
+
+
+def test_cache_keeps_only_the_most_recent_blocks(encoding):
+    size = codexify_main._TOKEN_COUNT_CACHE_SIZE
+    for i in range(size + 5):
+        codexify_main._count_tokens(encoding, [f"block {i}\n"])
+
+    assert len(codexify_main._TOKEN_COUNT_CACHE) == size
+    codexify_main._count_tokens(encoding, [f"block {size + 4}\n"])
+    assert len(encoding.encoded) == size + 5  # The newest block is still cached
+    codexify_main._count_tokens(encoding, ["block 0\n"])
+    assert len(encoding.encoded) == size + 6  # The oldest was evicted
@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+from codexify.core.common import BASE_PERMANENT_EXCLUSIONS, CONFIG_FILE_PATTERN
+from codexify.core.tree_builder import (
+    build_filtered_file_list,
+    build_tree_and_file_list,
+    build_tree_structure,
+)
+
+
+def _parse_name_list(gitignore_path, base_dir):
+    """A gitignore stand-in: every line is a file or directory name to ignore anywhere."""
+    with open(gitignore_path) as f:
+        names = {line.strip() for line in f if line.strip()}
+    return lambda path: os.path.basename(path.rstrip(os.sep)) in names
+
+
+@pytest.fixture
+def project(tmp_path):
+    files = [
+        "main.py",
+        "README.md",
+        "Setup.PY",
+        "notes.txt",
+        "config.compiled.demo.yaml",
+        "pkg/__init__.py",
+        "pkg/core.py",
+        "pkg/data.json",
+        "pkg/generated.py",
+        "pkg/deep/er/leaf.py",
+        "build/out.py",
+        "node_modules/dep/index.js",
+        "logs/run.log",
+        "empty_dir/.keep",
+        ".gitignore",
+    ]
+    for rel_path in files:
+        path = tmp_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"# {rel_path}\n")
+    (tmp_path / ".gitignore").write_text("generated.py\nlogs\n")
+    return tmp_path
+
+
+@pytest.mark.parametrize("use_gitignore", [True, False], ids=["gitignore", "no-gitignore"])
+@pytest.mark.parametrize(
+    "extensions, exclude_dirs, exclude_files",
+    [
+        ([".py"], [], []),
+        ([".py", ".md", ".json"], ["build"], ["core.py"]),
+        ([], [], []),
+        (["README.md", ".PY"], ["pkg"], ["notes.txt"]),
+    ],
+    ids=["py", "mixed-with-excludes", "no-extensions", "exact-name-and-upper"],
+)
+def test_single_walk_matches_separate_walks(project, use_gitignore, extensions, exclude_dirs, exclude_files):
+    root = str(project)
+    gitignore = str(project / ".gitignore") if use_gitignore else None
+    permanent = frozenset(BASE_PERMANENT_EXCLUSIONS)
+
+    tree, file_list = build_tree_and_file_list(
+        root, extensions, exclude_dirs, exclude_files, gitignore, _parse_name_list, permanent, CONFIG_FILE_PATTERN
+    )
+
+    assert tree == build_tree_structure(
+        root, True, gitignore, _parse_name_list, permanent, exclude_dirs, exclude_files, extensions
+    )
+    assert file_list == build_filtered_file_list(
+        root, extensions, exclude_dirs, exclude_files, gitignore, _parse_name_list, permanent, CONFIG_FILE_PATTERN
+    )
+
+
+def test_file_list_applies_every_rule(project):
+    _, file_list = build_tree_and_file_list(
+        str(project),
+        [".py"],
+        ["build"],
+        ["core.py"],
+        str(project / ".gitignore"),
+        _parse_name_list,
+        frozenset(BASE_PERMANENT_EXCLUSIONS),
+        CONFIG_FILE_PATTERN,
+    )
+
+    assert file_list == ["Setup.PY", "main.py", "pkg/__init__.py", "pkg/deep/er/leaf.py"]
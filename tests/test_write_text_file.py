@@ -0,0 +1,59 @@
+import os
+
+import pytest
+
+from codexify import main as codexify_main
+
+_TEXT = "first line\nsecond — ligne\n\nlast line without newline"
+
+
+@pytest.mark.parametrize("linesep", ["\n", "\r\n"], ids=["lf", "crlf"])
+def test_newlines_are_translated_like_text_mode(tmp_path, monkeypatch, linesep):
+    monkeypatch.setattr(codexify_main.os, "linesep", linesep)
+    target = tmp_path / "out.txt"
+
+    codexify_main._write_text_file(str(target), _TEXT)
+
+    assert target.read_bytes() == _TEXT.replace("\n", linesep).encode("utf-8")
+
+
+def test_matches_a_text_mode_write(tmp_path):
+    expected = tmp_path / "expected.txt"
+    with open(expected, "w", encoding="utf-8") as f:
+        f.write(_TEXT)
+    target = tmp_path / "out.txt"
+
+    codexify_main._write_text_file(str(target), _TEXT)
+
+    assert target.read_bytes() == expected.read_bytes()
+    if os.name != "nt":
+        assert os.stat(target).st_mode == os.stat(expected).st_mode
+
+
+def test_short_writes_are_continued(tmp_path, monkeypatch):
+    real_write = os.write
+    monkeypatch.setattr(codexify_main.os, "write", lambda fd, data: real_write(fd, data[:3]))
+    target = tmp_path / "out.txt"
+
+    codexify_main._write_text_file(str(target), _TEXT)
+
+    assert target.read_bytes() == _TEXT.replace("\n", os.linesep).encode("utf-8")
+
+
+def test_existing_file_is_truncated(tmp_path):
+    target = tmp_path / "out.txt"
+    target.write_text("a much longer previous output\n" * 10)
+
+    codexify_main._write_text_file(str(target), "short\n")
+
+    assert target.read_bytes() == f"short{os.linesep}".encode("utf-8")
+
+
+def test_encoding_error_leaves_the_existing_file_untouched(tmp_path):
+    target = tmp_path / "out.txt"
+    target.write_text("previous output\n")
+
+    with pytest.raises(UnicodeEncodeError):
+        codexify_main._write_text_file(str(target), "lone surrogate \udc80\n")
+
+    assert target.read_text() == "previous output\n"
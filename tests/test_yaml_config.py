@@ -0,0 +1,88 @@
+import pytest
+
+from codexify.cli import _clear_path_caches, _load_config_from_yaml_for_cli
+
+yaml = pytest.importorskip("yaml")
+
+
+@pytest.fixture(autouse=True)
+def fresh_path_caches():
+    _clear_path_caches()
+    yield
+    _clear_path_caches()
+
+
+def _write_config(tmp_path, text):
+    config_file = tmp_path / "config.compiled.test.yaml"
+    config_file.write_text(text)
+    return str(config_file)
+
+
+def test_loads_known_keys_relative_to_config_dir(tmp_path):
+    config_file = _write_config(
+        tmp_path,
+        "path: src\n"
+        "extensions: [.py, .md]\n"
+        "packages: [example.com/pkg]\n"
+        "output: report\n"
+        "exclude: [build]\n"
+        "exclude_files: [a.log]\n"
+        "gitignore: .customignore\n"
+        "extra:\n"
+        "  - ignored\n",
+    )
+
+    loaded = _load_config_from_yaml_for_cli(config_file, yaml)
+
+    assert loaded["project_path"] == str(tmp_path / "src")
+    assert loaded["extensions"] == [".py", ".md"]
+    assert loaded["go_packages"] == ["example.com/pkg"]
+    assert loaded["output_base_name_no_ext"] == "report"
+    assert loaded["exclude_dirs"] == ["build"]
+    assert loaded["exclude_files"] == ["a.log"]
+    assert loaded["gitignore_file_path"] == str(tmp_path / ".customignore")
+    assert loaded["config_source_dir"] == str(tmp_path)
+
+
+def test_later_quoted_duplicate_key_wins(tmp_path):
+    config_file = _write_config(
+        tmp_path,
+        "path: first\n"
+        "extensions: [.py]\n"
+        "extra: value\n"
+        '"path": second\n',
+    )
+
+    loaded = _load_config_from_yaml_for_cli(config_file, yaml)
+
+    assert loaded["project_path"] == str(tmp_path / "second")
+
+
+def test_syntax_error_in_unknown_section_is_rejected(tmp_path, capsys):
+    config_file = _write_config(
+        tmp_path,
+        "path: .\n"
+        "extensions: [.py]\n"
+        "extra: [unclosed\n",
+    )
+
+    with pytest.raises(SystemExit) as excinfo:
+        _load_config_from_yaml_for_cli(config_file, yaml)
+
+    assert excinfo.value.code == 1
+    assert "Error parsing YAML" in capsys.readouterr().out
+
+
+def test_unsafe_tag_in_unknown_section_is_rejected(tmp_path, capsys):
+    config_file = _write_config(
+        tmp_path,
+        "path: .\n"
+        "extensions: [.py]\n"
+        "extra: !!python/object/apply:os.system ['echo unsafe']\n",
+    )
+
+    with pytest.raises(SystemExit) as excinfo:
+        _load_config_from_yaml_for_cli(config_file, yaml)
+
+    assert excinfo.value.code == 1
+    assert "Error parsing YAML" in capsys.readouterr().out